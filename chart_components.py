@@ -155,7 +155,7 @@ class LineChart:
         self.ax.legend(loc='upper right', framealpha=0.7)
         
         # Draw the plot
-        self.canvas.draw()
+        self.canvas.draw_idle()
     
     def on_hover(self, event):
         """Handle mouse hover event"""
@@ -302,7 +302,7 @@ class GaugeChart:
         self.ax.set_ylim(0, 1)
         
         # Draw the plot
-        self.canvas.draw()
+        self.canvas.draw_idle()
     
     def pack(self, **kwargs):
         """Pack the chart widget"""
@@ -402,7 +402,7 @@ class BarChart:
                 self.ax.text(i, v + 2, f"{v:.0f}", ha='center', va='bottom', fontsize=8, color='white')
         
         # Draw the plot
-        self.canvas.draw()
+        self.canvas.draw_idle()
     
     def pack(self, **kwargs):
         """Pack the chart widget"""
@@ -540,7 +540,7 @@ class MultiLineChart:
         self.ax.legend(loc='upper right', framealpha=0.7, fontsize=8)
         
         # Draw the plot
-        self.canvas.draw()
+        self.canvas.draw_idle()
     
     def _compute_moving_average(self, values, window_size):
         """Compute moving average of values"""
@@ -6,20 +6,44 @@ A single-file application that monitors network traffic with a modern, futuristi
 
 import tkinter as tk
 from tkinter import ttk
+import tkinter.font as tkFont
 import time
 import threading
-import random
+import queue
 import math
 import os
+import re
+import sys
+import functools
+import types
+import weakref
 from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 import numpy as np
 import csv
 from datetime import datetime
 import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import matplotlib.patheffects as path_effects
 from matplotlib.ticker import MaxNLocator
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+from queue_utils import put_latest
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional - without it the kernels below run as plain NumPy
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Every chart uses the dark theme; apply it once for the process rather than per chart
+plt.style.use('dark_background')
 
 # Network binary codes - 2-bit system
 # First bit: 0=authorized, 1=unauthorized
@@ -29,9 +53,160 @@ AUTH_MALICIOUS = "01" # Authorized but malicious
 UNAUTH_SAFE = "10"    # Unauthorized but non-malicious
 UNAUTH_MALICIOUS = "11" # Unauthorized and malicious
 
+# Authorization decision per port (0-65535) - even ports are authorized
+_AUTH_TABLE = (np.arange(65536) & 1) == 0
+
+# FPGA serial line: source_ip,dest_ip,protocol,port,bytes_sent,bytes_received,status.
+# Field lengths are capped at the _CONN_DTYPE widths, so an over-long value rejects the
+# line instead of being truncated into a row whose index key no longer matches
+_SERIAL_LINE = re.compile(rb"\s*([^,]+),([^,]{1,16}),([^,]{1,8}),(\d{1,5}),(\d{1,19}),(\d{1,19}),"
+                          rb"([^\s,]{1,12})(?![^\s,])")
+
+# Characters that force CSV quoting; exports without them are written as plain joined lines
+_CSV_SPECIAL = re.compile(r'[",\r\n]')
+_EXPORT_HEADER = ['Timestamp', 'Source IP', 'Destination IP', 'Authorized', 'Traffic Value']
+
+# Icon shown next to each connection's protocol. Parsed protocol, destination and status
+# strings are interned, so lookups here, "ACTIVE" tests and the connection-index keys
+# compare by identity first and repeated values share one object
+_PROTO_ICON = {"HTTP": "⚡", "HTTPS": "⚡", "SSH": "🔒", "DNS": "🔍"}
+
+# Column layout of a device's connection table (one structured row per connection).
+# 'active' mirrors status == "ACTIVE"; 'created' is a time.perf_counter() reading, so a
+# connection's duration is perf_counter() - created and never jumps with the wall clock.
+# Every row is written whole, so 'authorized' is always set (zeroed rows read as unauthorized).
+# 'label' ("PROTO → dest:port") is formatted once when the row is added, on the data thread
+_CONN_DTYPE = np.dtype([
+    ('source', 'U16'), ('destination', 'U16'), ('protocol', 'U8'), ('port', 'u2'),
+    ('status', 'U12'), ('bytes_sent', 'u8'), ('bytes_received', 'u8'), ('packets', 'u4'),
+    ('created', 'f8'), ('active', '?'), ('authorized', '?'), ('label', 'U40'),
+])
+
+
+# Gauge sample grids - a ~300px gauge can't resolve more than a few dozen segments
+_THETA_FULL = np.linspace(0, 2*np.pi, 64)
+_R_FULL = np.full(64, 0.9)
+_ARC_STEPS = np.linspace(0, 1, 32)
+
+
+# Every live chart, so batched_updates() can defer and flush them together
+_charts = weakref.WeakSet()
+
+
+@contextmanager
+def batched_updates(flush=True):
+    """Hold back redraws of every chart inside the block, then flush each one once.
+    With flush=False the redraws stay pending until a later flushing batch"""
+    charts = list(_charts)
+    for chart in charts:
+        chart.defer_draw = True
+    try:
+        yield
+    finally:
+        for chart in charts:
+            chart.defer_draw = False
+            if flush:
+                chart.flush()
+
+
+@njit(cache=True, fastmath=True)
+def smooth_matrix(hist, out, window):
+    """Moving average of every row of hist into out, the first window-1 samples held at the row's start"""
+    n = hist.shape[1]
+    if n < window:
+        out[:, :] = hist
+        return out
+
+    # Sum of the window's shifted slices, written straight into out - no temporaries
+    tail = out[:, window-1:]
+    tail[:, :] = hist[:, window-1:]
+    for k in range(1, window):
+        tail += hist[:, window-1-k:n-k]
+    tail *= 1.0 / window
+
+    # Pad beginning to match original length
+    for t in range(window - 1):
+        out[:, t] = hist[:, 0]
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _bump_active(bytes_sent, bytes_received, packets, idx, sent, received, pkts):
+    """Add one tick's random increments to the active rows idx of a connection table (in place)"""
+    bytes_sent[idx] += sent
+    bytes_received[idx] += received
+    packets[idx] += pkts
+
+
+@functools.lru_cache(maxsize=None)
+def _background_hills():
+    """Wavy background hill outlines shared by every line chart, computed once"""
+    x = np.linspace(0, 1, 100)
+    y_base = np.zeros_like(x)
+    layers = []
+    for i in range(3):
+        phase = i * np.pi / 3
+        y = 0.03 * np.sin(8 * x + phase) + 0.05 * np.sin(5 * x + phase) + y_base
+        layers.append((y_base, y))
+        y_base = y
+    return x, tuple(layers)
+
+
+@functools.lru_cache(maxsize=256)
+def _display_ip(ip):
+    """Dotted-decimal form of a device IP, decoding 'c0a8....' hex addresses as a 32-bit int"""
+    if not ip.startswith('c0a8'):
+        return ip
+    try:
+        n = int(ip, 16)
+    except ValueError:
+        return ip
+    return f"{(n >> 24) & 0xFF}.{(n >> 16) & 0xFF}.{(n >> 8) & 0xFF}.{n & 0xFF}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_bytes(bytes_value):
+    """Format bytes to human-readable format (memoized - callers pass int counts so repeats hit)"""
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if bytes_value < 1024.0:
+            return f"{bytes_value:.1f} {unit}"
+        bytes_value /= 1024.0
+    return f"{bytes_value:.1f} TB"
+
+class _HistoryRing:
+    """Last size samples of each series (series x 2*size). Every sample is written twice,
+    size apart, so the latest samples are always one contiguous, time-ordered slice"""
+    def __init__(self, n_series, size):
+        self.size = size
+        self.buf = np.zeros((n_series, 2 * size), dtype=np.float32)
+        self.head = 0
+        self.filled = 0
+
+    def __len__(self):
+        return len(self.buf)
+
+    def push(self, new_values):
+        """Record one sample in the ring and return the (series x samples) view"""
+        n = self.size
+        pos = self.head
+        k = min(len(new_values), len(self.buf))
+        column = self.buf[:, pos]
+        column[:k] = new_values[:k]
+        column[k:] = 0
+        self.buf[:, pos + n] = column
+        self.head = (pos + 1) % n
+        self.filled = min(self.filled + 1, n)
+        return self.buf[:, pos + n + 1 - self.filled:pos + n + 1]
+
+
 class FuturisticLineChart:
     def __init__(self, parent, title, labels, colors, bg_color='#080f1c', grid_color='#143062', 
-                 width=600, height=300, line_width=3.0, font_color='#e0f2ff', show_hover_values=False):
+                 width=600, height=300, line_width=3.0, font_color='#e0f2ff', show_hover_values=False,
+                 style=None, render_every=1):
+        # A shared style object overrides the individual color arguments
+        if style is not None:
+            bg_color, grid_color, font_color = style.bg, style.grid, style.fg
+
         self.parent = parent
         self.title = title
         self.labels = labels
@@ -49,6 +224,9 @@ class FuturisticLineChart:
         self.device_names = None
         self.device_ips = None
 
+        # Owning dashboard (the one with node_data); set by the dashboard or found once
+        self.app = None
+
         # For tracking device selection
         self.selected_device_idx = None
         self.last_click_time = 0
@@ -56,6 +234,10 @@ class FuturisticLineChart:
         # Tooltip for displaying detailed information when hovering
         self.detail_tooltip = None
 
+        # Formatted tooltip parts per (device, data version); update_data bumps the version
+        self._tooltip_cache = {}
+        self._data_version = 0
+
         # Pause traffic when hovering
         self.hovering = False
         self.hover_device_index = None
@@ -72,7 +254,6 @@ class FuturisticLineChart:
         }
 
         # Create figure and axes
-        plt.style.use('dark_background')
         self.fig = Figure(figsize=(width/100, height/100), dpi=100)
         self.ax = self.fig.add_subplot(111)
 
@@ -89,9 +270,36 @@ class FuturisticLineChart:
         self.canvas_widget.config(width=width, height=height)
 
         # Initialize empty plot
-        self.lines = []
+        self._n_series = 0
         self.hover_annotation = None
-        self.data_history = []
+        self.max_points = 30
+
+        # History of the last max_points samples per series
+        self._ring = _HistoryRing(min(len(labels), len(colors)), self.max_points)
+        self._smooth_buf = np.empty((len(self._ring), self.max_points))
+
+        # Line vertices (series x points x 2); x never changes, renders only rewrite y
+        self._xy_buf = np.empty((len(self._ring), self.max_points, 2))
+        self._xy_buf[:, :, 0] = np.arange(self.max_points)
+
+        # Data pushed since the last render, and how often to render
+        self.render_every = render_every
+        self._tick = 0
+        self._render_history = None
+        self._render_series = 0
+        self._render_timestamp = None
+
+        # Producer version of the last update, to recognise a repeated frame
+        self._last_version = None
+
+        # Cached static background for blitting (captured on every full draw)
+        self._bg = None
+
+        # Redraw batching - while defer_draw is set, redraws wait for flush()
+        self.defer_draw = False
+        self._pending_draw = False
+        self._pending_full = False
+        _charts.add(self)
 
         # Create tooltip
         self.tooltip = tk.Label(
@@ -110,9 +318,11 @@ class FuturisticLineChart:
         self.canvas.mpl_connect('motion_notify_event', self.on_hover)
         self.canvas.mpl_connect('figure_leave_event', self.on_leave)
         self.canvas.mpl_connect('button_press_event', self.on_click)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
 
         # Initial plot setup
         self._setup_plot()
+        self._create_artists()
 
         # Store selected device index
         self.selected_device_idx = None
@@ -144,38 +354,78 @@ class FuturisticLineChart:
         self.ax.spines['bottom'].set_color(self.grid_color)
         self.ax.spines['left'].set_color(self.grid_color)
 
-        # Add subtle background gradient effect like in the reference image
-        gradient = np.linspace(0, 1, 100).reshape(1, -1)
-        gradient = np.vstack((gradient, gradient))
-        extent = [0, 1, 0, 0.15]
-
-        # Create a very subtle background hill effect
-        x = np.linspace(0, 1, 100)
-        y_base = 0
-
-        for i in range(3):
-            # Create wavy background hills
-            phase = i * np.pi / 3
-            y = 0.03 * np.sin(8 * x + phase) + 0.05 * np.sin(5 * x + phase) + y_base
+        # Create a very subtle background hill effect like in the reference image
+        x, layers = _background_hills()
+        for y_base, y in layers:
             self.ax.fill_between(x, y_base, y, color=self.grid_color, alpha=0.07, zorder=-10)
-            y_base = y
 
         # Adjust layout
         self.fig.tight_layout()
 
-    def _get_smooth_data(self, data, window=5):
-        """Create smoothed version of data for more natural curves"""
-        if len(data) < window:
-            return data
-
-        # Simple moving average for smoothing
-        smoothed = np.convolve(data, np.ones(window)/window, mode='valid')
-        # Pad beginning to match original length
-        padding = np.full(window-1, data[0])
-        return np.concatenate([padding, smoothed])
+    def _create_artists(self):
+        """Create the persistent line, endpoint and label artists that are redrawn by blitting"""
+        n_series = self._n_series = min(len(self.labels), len(self.colors))
+        self.ax.set_xlim(-1, self.max_points)  # Leave room for the endpoint dots
+        series_colors = list(self.colors[:n_series])
+
+        # All series as one collection, with high-quality smoothing and rounded joins.
+        # Segment i always takes color i, so a shorter update still colors correctly
+        self._lines = LineCollection([], colors=series_colors,
+                                     linewidths=self.line_width,
+                                     capstyle='round',
+                                     joinstyle='round',
+                                     path_effects=[path_effects.SimpleLineShadow(offset=(1, -1), alpha=0.3),
+                                                   path_effects.Normal()],
+                                     animated=True)
+        self.ax.add_collection(self._lines)
+        self._line_xy = np.empty((0, 0, 2))
+
+        # Endpoint dots - subtle shadow first then the main dot, one offset per series
+        self._end_shadows = self.ax.scatter(np.empty(0), np.empty(0), s=30, color='black', alpha=0.2,
+                                            zorder=9, animated=True)
+        self._end_dots = self.ax.scatter(np.empty(0), np.empty(0), s=20,
+                                         edgecolor='white', linewidth=0.5, zorder=10,
+                                         animated=True)
+        self._end_dots.set_facecolor(series_colors)
+
+        # Current timestamp
+        self._timestamp_text = self.ax.text(0.98, 0.02, "", 
+                                            transform=self.ax.transAxes, 
+                                            ha='right', va='bottom', 
+                                            color=self.font_color, alpha=0.7, fontsize=7,
+                                            animated=True)
+
+        # Legend with custom styling, kept above the lines
+        self._legend = None
+        if n_series > 0:
+            handles = [Line2D([0], [0], color=self.colors[i], lw=2) for i in range(n_series)]
+            self._legend = self.ax.legend(handles, self.labels[:n_series], loc='upper right', framealpha=0.3, 
+                                          fontsize=8, labelcolor=self.font_color, facecolor=self.bg_color)
+            self._legend.set_animated(True)
+
+        self._animated = [self._lines, self._end_shadows, self._end_dots, self._timestamp_text]
+        if self._legend is not None:
+            self._animated.append(self._legend)
+
+    def _draw_animated(self):
+        """Draw the moving artists on top of whatever is in the canvas buffer"""
+        for artist in self._animated:
+            self.ax.draw_artist(artist)
+
+    def _on_draw(self, event):
+        """Cache the static background after a full redraw and put the moving artists back"""
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_animated()
+
+    def update_data(self, new_values, timestamp=None, connection_details=None, device_names=None, device_ips=None,
+                    history=None, version=None):
+        """Update the chart with new data points and connection details for hover information.
+        version is the producer's snapshot counter; a repeated version needs no work at all"""
+        if version is not None:
+            if version == self._last_version:
+                return
+            self._last_version = version
 
-    def update_data(self, new_values, timestamp=None, connection_details=None, device_names=None, device_ips=None):
-        """Update the chart with new data points and connection details for hover information"""
         # Store connection details for hover functionality if provided
         if connection_details is not None:
             self.connection_details = connection_details
@@ -184,78 +434,126 @@ class FuturisticLineChart:
         if device_ips is not None:
             self.device_ips = device_ips
 
-        # Keep a history of the data for smoother transitions
-        self.data_history.append(new_values)
-        if len(self.data_history) > 30:  # Keep only the last 30 data points
-            self.data_history = self.data_history[-30:]
+        # Connection data may have changed - drop the formatted tooltips
+        self._data_version += 1
+        self._tooltip_cache.clear()
 
-        # Clear previous plot
-        self.ax.clear()
-        self.lines = []
+        if history is not None:
+            # Caller keeps the history (series x samples) - plot its rows as they are
+            self._render_history = history[:, -self.max_points:]
+            self._render_series = min(len(history), self._n_series)
+        else:
+            # Keep a history of the data for smoother transitions
+            self._render_history = self._ring.push(new_values)
+            self._render_series = min(len(new_values), self._n_series)
+        self._render_timestamp = timestamp
+
+        # Only every render_every-th sample is drawn; the rest just extend the history.
+        # (The dashboard stops pushing data altogether while its window is unmapped)
+        self._tick += 1
+        if self._tick % self.render_every == 0:
+            self.render()
+
+    def render(self):
+        """Redraw the chart from the most recently pushed data"""
+        if self._render_history is None:
+            return
 
-        # Setup plot again
-        self._setup_plot()
+        # Smooth every series in one pass over the (series x samples) history
+        history = self._render_history[:self._render_series]
+        smooth_data = smooth_matrix(history, self._smooth_buf[:len(history), :history.shape[1]], 5)
+
+        # Scale the y-axis to show all spikes, never below the initial limit
+        y_max = 100
+        if smooth_data.size:
+            max_value = smooth_data.max() * 1.2  # Add 20% headroom
+            if max_value > 100:
+                y_max = max_value
+
+        # Move the persistent artists to the new data: (series x points x 2) segments
+        n_points = smooth_data.shape[1] if len(smooth_data) else 0
+        xy = self._xy_buf[:len(smooth_data), :n_points]
+        if smooth_data.size:
+            xy[:, :, 1] = smooth_data
+        self._line_xy = xy
+        self._lines.set_segments(xy)
+        end = xy[:, -1] if n_points else np.empty((0, 2))
+        self._end_shadows.set_offsets(end)
+        self._end_dots.set_offsets(end)
+
+        self._timestamp_text.set_text(self._render_timestamp or "")
+
+        # Axis limits are part of the cached background, so a change needs a full redraw.
+        # Rescale with some slack - grow past the new peak, shrink only once the data has
+        # fallen well below the top - so small fluctuations keep taking the blit path
+        full = False
+        y_top = self.ax.get_ylim()[1]
+        if y_max > y_top or y_max < y_top * 0.5:
+            self.ax.set_ylim(0, y_max if y_max == 100 else y_max * 1.25)
+            full = True
+
+        self._pending_full = self._pending_full or full
+        self._pending_draw = True
+        if not self.defer_draw:
+            self.flush()
+
+    def flush(self):
+        """Perform the redraw held back while defer_draw was set"""
+        if not self._pending_draw:
+            return
+        full = self._pending_full or self._bg is None
+        self._pending_draw = False
+        self._pending_full = False
 
-        # Create smooth data by interpolating between points
-        smooth_data = []
-
-        # For each data series (device or metric)
-        for i in range(len(new_values)):
-            if i < len(self.colors) and i < len(self.labels):
-                # Extract history for this series
-                series_history = [d[i] if i < len(d) else 0 for d in self.data_history]
-                # Create smoother curve by interpolating between points
-                smooth_data.append(self._get_smooth_data(series_history))
-
-        # Get the x values for plotting
-        x = np.arange(len(smooth_data[0])) if smooth_data else []
-
-        # Calculate maximum y-value to adjust the scale to show all spikes
-        if smooth_data:
-            all_values = [item for sublist in smooth_data for item in sublist]
-            if all_values:
-                max_value = max(all_values) * 1.2  # Add 20% headroom
-                if max_value > 100:  # If we need more than the initial limit
-                    self.ax.set_ylim(0, max_value)
-
-        # Plot each data series with smooth curves like in the reference image
-        for i, values in enumerate(smooth_data):
-            if i < len(self.colors) and i < len(self.labels):
-                base_color = self.colors[i]
-
-                # Draw the main line with high-quality smoothing and rounded joins
-                line = self.ax.plot(x, values, color=base_color, 
-                                  linewidth=self.line_width,
-                                  solid_capstyle='round', 
-                                  solid_joinstyle='round',
-                                  path_effects=[path_effects.SimpleLineShadow(offset=(1, -1), alpha=0.3),
-                                                path_effects.Normal()])
-
-                # Add a dot at the end of each line
-                if len(values) > 0:
-                    # Add an endpoint dot - subtle shadow first then the main dot
-                    self.ax.scatter([x[-1]], [values[-1]], s=30, color='black', alpha=0.2, zorder=9)
-                    self.ax.scatter([x[-1]], [values[-1]], s=20, color=base_color, 
-                                   edgecolor='white', linewidth=0.5, zorder=10)
-
-                self.lines.append(line[0])
-
-        # Add current timestamp if provided
-        if timestamp:
-            self.ax.text(0.98, 0.02, timestamp, 
-                       transform=self.ax.transAxes, 
-                       ha='right', va='bottom', 
-                       color=self.font_color, alpha=0.7, fontsize=7)
-
-        # Update legend with custom styling
-        if len(self.labels) > 0:
-            handles = [plt.Line2D([0], [0], color=self.colors[i], lw=2) 
-                       for i in range(min(len(self.labels), len(self.colors)))]
-            self.ax.legend(handles, self.labels, loc='upper right', framealpha=0.3, 
-                         fontsize=8, labelcolor=self.font_color, facecolor=self.bg_color)
-
-        # Draw the plot
-        self.canvas.draw()
+        if full:
+            self.canvas.draw_idle()
+        else:
+            # Only the moving artists are repainted over the cached background
+            self.canvas.restore_region(self._bg)
+            self._draw_animated()
+            self.canvas.blit(self.ax.bbox)
+
+    def _nearest_line(self, event, max_dist=50):
+        """Index of the line with a data point closest to the mouse, within max_dist pixels"""
+        xy = self._line_xy
+        # Check if there's line data available
+        if not xy.size:
+            return None
+
+        # Convert every point of every line to display coordinates at once
+        pts = self.ax.transData.transform(xy.reshape(-1, 2))
+        d2 = (pts[:, 0] - event.x) ** 2 + (pts[:, 1] - event.y) ** 2
+        j = d2.argmin()
+        if d2[j] >= max_dist ** 2:
+            return None
+        return int(j // xy.shape[1])
+
+    def _format_tooltip(self, idx, device_connections):
+        """Build the static header and connection list of a device's tooltip"""
+        device_name = self.device_names[idx] if self.device_names else f"Device {idx+1}"
+        # Convert hex IP to decimal format
+        device_ip = _display_ip(self.device_ips[idx]) if self.device_ips else "Unknown IP"
+
+        # Create detailed tooltip with connection information
+        header = f"{device_name} ({device_ip}) - PAUSED\n"
+        text = "Active Connections:\n"
+
+        # List up to 3 connections to keep tooltip manageable
+        for i, conn in enumerate(device_connections[:3].tolist()):
+            (_, _, _, _, status, bytes_sent, bytes_received, _, _, _, authorized, label) = conn
+
+            # Formatbytes in a readable way
+            bytes_sent = _format_bytes(bytes_sent)
+            bytes_received = _format_bytes(bytes_received)
+
+            text += f"{i+1}. {label}\n"
+            text += f"   Status: {status} | Sent: {bytes_sent} | Recv: {bytes_received}\n"
+            auth_status = "✓ Authorized" if authorized else "⚠ Unauthorized"
+            text += f"   {auth_status}\n"
+
+        if len(device_connections) > 3:
+            text += f"\n+ {len(device_connections) - 3} more connections"
+        return header, text
 
     def on_hover(self, event):
         """Handle mouse hover event with detailed connection information"""
@@ -267,28 +565,7 @@ class FuturisticLineChart:
             x, y = event.x, event.y
 
             # See if we're hovering over a line point
-            closest_line_idx = None
-            closest_dist = float('inf')
-
-            # Find closest data point
-            for i, line in enumerate(self.lines):
-                # Check if there's line data available
-                if not line.get_xdata().size or not line.get_ydata().size:
-                    continue
-
-                # Get the line data
-                line_xdata = line.get_xdata()
-                line_ydata = line.get_ydata()
-
-                # Find the closest point on the line
-                for j in range(len(line_xdata)):
-                    # Convert data coordinates to display coordinates
-                    display_coords = self.ax.transData.transform((line_xdata[j], line_ydata[j]))
-                    dist = np.sqrt((display_coords[0] - event.x)**2 + (display_coords[1] - event.y)**2)
-
-                    if dist < closest_dist and dist < 50:  # Within 50 pixels
-                        closest_dist = dist
-                        closest_line_idx = i
+            closest_line_idx = self._nearest_line(event)
 
             # Set paused state if we're hovering over a line
             if closest_line_idx is not None:
@@ -308,40 +585,24 @@ class FuturisticLineChart:
             # If we have connection details and we're hovering near a line
             if self.connection_details and closest_line_idx is not None and closest_line_idx < len(self.connection_details):
                 device_connections = self.connection_details[closest_line_idx]
-                if device_connections and len(device_connections) > 0:
-                    device_name = self.device_names[closest_line_idx] if self.device_names else f"Device {closest_line_idx+1}"
-                    # Convert hex IP to decimal format
-                    hex_ip = self.device_ips[closest_line_idx] if self.device_ips else "Unknown IP"
-                    if hex_ip.startswith('c0a8'):  # Check if it's a hex IP
-                        try:
-                            # Convert hex to decimal IP format
-                            ip_hex = hex_ip
-                            ip_parts = [str(int(ip_hex[i:i+2], 16)) for i in range(0, len(ip_hex), 2)]
-                            device_ip = '.'.join(ip_parts)
-                        except:
-                            device_ip = hex_ip
-                    else:
-                        device_ip = hex_ip
-
-                    # Create detailed tooltip with connection information
-                    text = f"{device_name} ({device_ip}) - PAUSED\n"
-                    text += f"Traffic: {event.ydata:.2f} Mbps\n\n"
-                    text += "Active Connections:\n"
-
-                    # List up to 3 connections to keep tooltip manageable
-                    for i, conn in enumerate(device_connections[:3]):
-                        # Formatbytes in a readable way
-                        bytes_sent = self._format_bytes(conn["bytes_sent"]) if "bytes_sent" in conn else "N/A"
-                        bytes_received = self._format_bytes(conn["bytes_received"]) if "bytes_received" in conn else "N/A"
-
-                        text += f"{i+1}. {conn['protocol']} → {conn['destination']}:{conn['port']}\n"
-                        text += f"   Status: {conn['status']} | Sent: {bytes_sent} | Recv: {bytes_received}\n"
-                        if "authorized" in conn:
-                            auth_status = "✓ Authorized" if conn["authorized"] else "⚠ Unauthorized" 
-                            text += f"   {auth_status}\n"
-
-                    if len(device_connections) > 3:
-                        text += f"\n+ {len(device_connections) - 3} more connections"
+                if len(device_connections) > 0:
+                    # Only the traffic line follows the cursor; the rest is cached per data version
+                    key = (closest_line_idx, self._data_version)
+                    parts = self._tooltip_cache.get(key)
+                    if parts is None:
+                        # The serial thread appends rows and the data worker evicts them, so the
+                        # live table is read under the data lock rather than through the snapshot view
+                        app = self.find_app_reference()
+                        if app and hasattr(app, 'node_data'):
+                            lock = app.node_data.lock
+                            device_connections = app.node_data.devices[closest_line_idx]["connections"]
+                        else:
+                            lock = nullcontext()
+                        with lock:
+                            parts = self._format_tooltip(closest_line_idx, device_connections)
+                        self._tooltip_cache[key] = parts
+                    header, body = parts
+                    text = f"{header}Traffic: {event.ydata:.2f} Mbps\n\n{body}"
 
             # Create a more advanced tooltip if not already created
             if not hasattr(self, 'detail_tooltip') or not self.detail_tooltip:
@@ -385,6 +646,12 @@ class FuturisticLineChart:
             self.detail_tooltip.place(x=tooltip_x, y=tooltip_y)
 
     def find_app_reference(self):
+        """Find reference to the main application, walking the widget hierarchy only once"""
+        if self.app is None:
+            self.app = self._search_app_reference()
+        return self.app
+
+    def _search_app_reference(self):
         """Find reference to the main application by walking up the widget hierarchy"""
         parent = self.parent
         while parent:
@@ -413,47 +680,18 @@ class FuturisticLineChart:
 
         return None
 
-    def _format_bytes(self, bytes_value):
-        """Format bytes to human-readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if bytes_value < 1024.0:
-                return f"{bytes_value:.1f} {unit}"
-            bytes_value /= 1024.0
-        return f"{bytes_value:.1f} TB"
-
     def on_click(self, event):
         """Handle mouse click event to select a device"""
         if event.inaxes == self.ax and self.show_hover_values:
             # Find closest data point to click location
-            closest_line_idx = None
-            closest_dist = float('inf')
-
-            # Check each line (device)
-            for i, line in enumerate(self.lines):
-                # Check if there's line data available
-                if not line.get_xdata().size or not line.get_ydata().size:
-                    continue
-
-                # Get the line data
-                line_xdata = line.get_xdata()
-                line_ydata = line.get_ydata()
-
-                # Find the closest point on the line
-                for j in range(len(line_xdata)):
-                    # Convert data coordinates to display coordinates
-                    display_coords = self.ax.transData.transform((line_xdata[j], line_ydata[j]))
-                    dist = np.sqrt((display_coords[0] - event.x)**2 + (display_coords[1] - event.y)**2)
-
-                    if dist < closest_dist and dist < 50:  # Within 50 pixels
-                        closest_dist = dist
-                        closest_line_idx = i
+            closest_line_idx = self._nearest_line(event)
 
             # If we found a nearby line, select that device
             if closest_line_idx is not None:
                 app = self.find_app_reference()
                 if app and hasattr(app, 'node_data'):
                     # Check for double-click (less than 0.5 seconds between clicks)
-                    if hasattr(self, 'last_click_time') and time.time() - self.last_click_time < 0.5:
+                    if hasattr(self, 'last_click_time') and time.perf_counter() - self.last_click_time < 0.5:
                         # Double click - close device details and resume all graphs
                         app.node_data.paused = False
                         app.node_data.selected_device = None
@@ -461,8 +699,7 @@ class FuturisticLineChart:
                         self.hovering = False
 
                         # Close device details window if open
-                        if hasattr(app, 'detail_window') and app.detail_window.winfo_exists():
-                            app.detail_window.destroy()
+                        app._hide_detail_window()
                     else:
                         # Single click - select device and show details
                         app.node_data.paused = True
@@ -474,7 +711,7 @@ class FuturisticLineChart:
                         app._show_device_details(closest_line_idx)
 
                     # Store click time for double-click detection
-                    self.last_click_time = time.time()
+                    self.last_click_time = time.perf_counter()
 
     def on_leave(self, event):
         """Handle mouse leave event"""
@@ -498,10 +735,227 @@ class FuturisticLineChart:
         self.canvas_widget.pack(**kwargs)
 
 
+class FastLineCanvas(tk.Canvas):
+    """Line chart drawn straight onto a tk.Canvas - no matplotlib work per frame"""
+    def __init__(self, parent, title, labels, colors, bg_color='#080f1c', grid_color='#143062', 
+                 width=600, height=300, line_width=3.0, font_color='#e0f2ff', show_hover_values=False,
+                 style=None):
+        # A shared style object overrides the individual color arguments
+        if style is not None:
+            bg_color, grid_color, font_color = style.bg, style.grid, style.fg
+
+        super().__init__(parent, width=width, height=height, bg=bg_color, highlightthickness=0)
+        self.title = title
+        self.labels = labels
+        self.colors = colors
+        self.bg_color = bg_color
+        self.grid_color = grid_color
+        self.line_width = line_width
+        self.font_color = font_color
+        self.show_hover_values = show_hover_values  # Flag to control the value box on hover
+
+        self.max_points = 30
+        self.y_max = 100
+        self._smooth_data = np.empty((0, 0))
+
+        # History of the last max_points samples per series
+        self._ring = _HistoryRing(min(len(labels), len(colors)), self.max_points)
+        self._smooth_buf = np.empty((len(self._ring), self.max_points))
+
+        # Plot area margins in pixels (left, top, right, bottom)
+        self._margins = (55, 12, 12, 28)
+        self._w = width
+        self._h = height
+
+        # Redraw batching - while defer_draw is set, redraws wait for flush()
+        self.defer_draw = False
+        self._pending_draw = False
+        _charts.add(self)
+
+        self._create_items()
+        self.bind("<Configure>", self._on_resize)
+        if show_hover_values:
+            self.bind("<Motion>", self.on_hover)
+            self.bind("<Leave>", self.on_leave)
+
+    def _create_items(self):
+        """Create every canvas item once; updates only move them"""
+        tick_font = ("Segoe UI", 8)
+
+        # Grid lines with their y-axis labels
+        self._grid_lines = []
+        self._tick_labels = []
+        for _ in range(5):
+            self._grid_lines.append(self.create_line(0, 0, 0, 0, fill=self.grid_color))
+            self._tick_labels.append(self.create_text(0, 0, anchor='e', fill=self.font_color, font=tick_font))
+
+        # Left and bottom spines
+        self._spines = self.create_line(0, 0, 0, 0, 0, 0, fill=self.grid_color)
+
+        # Axis labels
+        self._xlabel = self.create_text(0, 0, text="Time", anchor='s', fill=self.font_color, font=("Segoe UI", 9))
+        self._ylabel = self.create_text(0, 0, text=self.title, angle=90, anchor='n', fill=self.font_color,
+                                        font=("Segoe UI", 9))
+
+        # One smoothed polyline and endpoint dot per series
+        n_series = min(len(self.labels), len(self.colors))
+        self._lines = []
+        self._dots = []
+        for i in range(n_series):
+            self._lines.append(self.create_line(0, 0, 0, 0, fill=self.colors[i], width=self.line_width,
+                                                smooth=True, splinesteps=12,
+                                                capstyle=tk.ROUND, joinstyle=tk.ROUND, state='hidden'))
+            self._dots.append(self.create_oval(0, 0, 0, 0, fill=self.colors[i], outline='white',
+                                               state='hidden'))
+
+        # Legend and current timestamp
+        self._legend = []
+        for i in range(n_series):
+            swatch = self.create_line(0, 0, 0, 0, fill=self.colors[i], width=2)
+            text = self.create_text(0, 0, text=self.labels[i], anchor='w', fill=self.font_color,
+                                    font=tick_font)
+            self._legend.append((swatch, text))
+        self._timestamp_text = self.create_text(0, 0, anchor='se', fill=self.font_color, font=("Segoe UI", 7))
+
+        # Series index of each line and dot item, for hover hit-testing
+        self._series_items = {item: i for i, item in enumerate(self._lines)}
+        self._series_items.update((item, i) for i, item in enumerate(self._dots))
+
+        # Hover value box, raised above the lines when shown
+        self._hover_box = self.create_rectangle(0, 0, 0, 0, fill=self.bg_color, outline=self.grid_color,
+                                                state='hidden')
+        self._hover_text = self.create_text(0, 0, anchor='nw', fill=self.font_color, font=tick_font,
+                                            state='hidden')
+
+        self._layout()
+
+    def _on_resize(self, event):
+        """Re-lay out for the new canvas size"""
+        self._w = event.width
+        self._h = event.height
+        self._layout()
+        self._render()
+
+    def _layout(self):
+        """Position the static items for the current size and y-range"""
+        left, top, right, bottom = self._margins
+        x0, x1 = left, self._w - right
+        y0, y1 = top, self._h - bottom
+
+        for k, (grid_line, label) in enumerate(zip(self._grid_lines, self._tick_labels)):
+            y = y1 - (y1 - y0) * k / 4
+            self.coords(grid_line, x0, y, x1, y)
+            self.coords(label, x0 - 6, y)
+            self.itemconfig(label, text=f"{self.y_max * k / 4:,.0f}")
+
+        self.coords(self._spines, x0, y0, x0, y1, x1, y1)
+        self.coords(self._xlabel, (x0 + x1) / 2, self._h - 2)
+        self.coords(self._ylabel, 2, (y0 + y1) / 2)
+
+        for i, (swatch, text) in enumerate(self._legend):
+            y = y0 + 8 + i * 14
+            self.coords(swatch, x1 - 90, y, x1 - 72, y)
+            self.coords(text, x1 - 66, y)
+        self.coords(self._timestamp_text, x1 - 4, y1 - 4)
+
+    def on_hover(self, event):
+        """Show the value of the series under the mouse at the nearest sample"""
+        item = self.find_closest(event.x, event.y, halo=6)
+        i = self._series_items.get(item[0]) if item else None
+        if i is None or i >= len(self._smooth_data) or not self._smooth_data.shape[1]:
+            self.on_leave(event)
+            return
+
+        # Invert the x mapping used by _render to find the sample under the mouse
+        left, top, right, bottom = self._margins
+        x_scale = (self._w - right - left) / (self.max_points + 1)
+        values = self._smooth_data[i]
+        j = min(max(int(round((event.x - left) / x_scale)) - 1, 0), len(values) - 1)
+
+        # find_closest returns the nearest item however far away it is
+        y = self._h - bottom - values[j] * (self._h - bottom - top) / self.y_max
+        if abs(y - event.y) > 10:
+            self.on_leave(event)
+            return
+
+        self.itemconfig(self._hover_text, text=f"{self.labels[i]}: {values[j]:,.0f}", state='normal')
+        self.coords(self._hover_text, event.x + 12, event.y + 8)
+        x0, y0, x1, y1 = self.bbox(self._hover_text)
+        self.coords(self._hover_box, x0 - 4, y0 - 2, x1 + 4, y1 + 2)
+        self.itemconfig(self._hover_box, state='normal')
+        self.tag_raise(self._hover_box)
+        self.tag_raise(self._hover_text)
+
+    def on_leave(self, event):
+        """Hide the hover value box"""
+        self.itemconfig(self._hover_box, state='hidden')
+        self.itemconfig(self._hover_text, state='hidden')
+
+    def update_data(self, new_values, timestamp=None):
+        """Update the chart with a new data point"""
+        # Keep only the last 30 data points
+        history = self._ring.push(new_values)[:min(len(new_values), len(self._lines))]
+        self._smooth_data = smooth_matrix(history, self._smooth_buf[:len(history), :history.shape[1]], 5)
+
+        # Rescale with slack so small fluctuations don't relabel the axis every tick
+        y_needed = 100
+        if self._smooth_data.size:
+            max_value = self._smooth_data.max() * 1.2  # Add 20% headroom
+            if max_value > 100:
+                y_needed = max_value
+        if y_needed > self.y_max or y_needed < self.y_max * 0.5:
+            self.y_max = y_needed if y_needed == 100 else y_needed * 1.25
+            self._layout()
+
+        self.itemconfig(self._timestamp_text, text=timestamp or "")
+
+        self._pending_draw = True
+        if not self.defer_draw:
+            self.flush()
+
+    def flush(self):
+        """Perform the redraw held back while defer_draw was set"""
+        if self._pending_draw:
+            self._pending_draw = False
+            self._render()
+
+    def _render(self):
+        """Move the polylines and endpoint dots to the current data"""
+        if not self._ring.filled:
+            return
+        left, top, right, bottom = self._margins
+        x0, x1 = left, self._w - right
+        y0, y1 = top, self._h - bottom
+
+        # Data index -1..max_points maps onto the plot width, like the matplotlib chart
+        x_scale = (x1 - x0) / (self.max_points + 1)
+        y_scale = (y1 - y0) / self.y_max
+
+        for i, (line, dot) in enumerate(zip(self._lines, self._dots)):
+            if i >= len(self._smooth_data):
+                self.itemconfig(line, state='hidden')
+                self.itemconfig(dot, state='hidden')
+                continue
+            values = np.asarray(self._smooth_data[i], dtype=float)
+            xs = x0 + (np.arange(len(values)) + 1) * x_scale
+            ys = y1 - values * y_scale
+            flat = np.column_stack((xs, ys)).ravel().tolist()
+            if len(flat) == 2:
+                flat = flat * 2
+            self.coords(line, *flat)
+            self.coords(dot, xs[-1] - 4, ys[-1] - 4, xs[-1] + 4, ys[-1] + 4)
+            self.itemconfig(line, state='normal')
+            self.itemconfig(dot, state='normal')
+
+
 class FuturisticGaugeChart:
     """Futuristic gauge chart for displaying percentage metrics"""
     def __init__(self, parent, title="", max_value=100, bg_color='#080f1c', color='#00c2ff', 
-                 width=300, height=300, font_color='#e0f2ff'):
+                 width=300, height=300, font_color='#e0f2ff', dpi=72, style=None):
+        # A shared style object overrides the individual color arguments
+        if style is not None:
+            bg_color, font_color = style.bg, style.fg
+
         self.parent = parent
         self.title = title
         self.max_value = max_value
@@ -509,21 +963,44 @@ class FuturisticGaugeChart:
         self.color = color
         self.width = width
         self.height = height
-        self.value = 0
+        self.dpi = dpi
+        self.value = None  # Nothing rendered yet
         self.font_color = font_color
 
-        # Create figure and axes
-        plt.style.use('dark_background')
-        self.fig = Figure(figsize=(width/100, height/100), dpi=100)
-        self.ax = self.fig.add_subplot(111, polar=True)
+        # Redraw batching - while defer_draw is set, redraws wait for flush()
+        self.defer_draw = False
+        self._pending_draw = False
+        _charts.add(self)
 
-        # Configure figure
-        self.fig.patch.set_facecolor(bg_color)
+        # Create figure and axes sized to the widget's on-screen pixels
+        self.fig = Figure(figsize=(width/dpi, height/dpi), dpi=dpi, facecolor=bg_color)
+        self.ax = self.fig.add_subplot(111, polar=True)
 
-        # Create canvas
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self.parent)
-        self.canvas_widget = self.canvas.get_tk_widget()
-        self.canvas_widget.config(width=width, height=height)
+        # The figure is rendered off the Tk thread with plain Agg; the Tk side only
+        # shows the finished frames in a PhotoImage on an ordinary canvas
+        self.canvas = FigureCanvasAgg(self.fig)
+        self.canvas_widget = tk.Canvas(self.parent, width=width, height=height,
+                                       bg=bg_color, highlightthickness=0)
+        self._photo = tk.PhotoImage(master=self.canvas_widget)
+        self.canvas_widget.create_image(0, 0, anchor=tk.NW, image=self._photo)
+        self._size = (width, height)
+        self.canvas_widget.bind('<Configure>', self._on_resize)
+
+        # Static decorations are built once; updates only touch the value artists
+        self._setup_gauge()
+
+        # Render worker: takes (value, size) requests and hands back PPM frames.
+        # Both queues hold one item, so at most one render is in flight.
+        # Requests are numbered; Tk polls for frames only until the newest one is shown
+        self._fig_lock = threading.Lock()
+        self._render_q = queue.Queue(maxsize=1)
+        self._frame_q = queue.Queue(maxsize=1)
+        self._requested_seq = 0
+        self._shown_seq = 0
+        self._drain_id = None
+        self._closed = False
+        threading.Thread(target=self._render_loop, daemon=True).start()
+        self.canvas_widget.bind('<Destroy>', self._on_destroy, add='+')
 
         # Initial plot
         self.update_data(0)
@@ -531,123 +1008,204 @@ class FuturisticGaugeChart:
         # Pack the canvas
         self.canvas_widget.pack(fill=tk.BOTH, expand=True)
 
-    def update_data(self, value):
-        """Update the chart with a new value"""
-        self.value = min(value, self.max_value)
-        percentage = (self.value / self.max_value) * 100
-
-        # Clear the axes
-        self.ax.clear()
+    def _setup_gauge(self):
+        """Create the static gauge artists and the persistent value artists"""
+        ax = self.ax
 
         # Set chart parameters
-        self.ax.set_theta_zero_location('N')
-        self.ax.set_theta_direction(-1)
+        ax.set_theta_zero_location('N')
+        ax.set_theta_direction(-1)
 
         # Hide the grid and axis
-        self.ax.grid(False)
-        self.ax.axis('off')
+        ax.grid(False)
+        ax.axis('off')
 
-        # Calculate angles
-        start_angle = 140  # Degrees
-        end_angle = 400    # Degrees 
-        value_angle = start_angle + (end_angle - start_angle) * (percentage / 100)
+        # Angles of the gauge sweep
+        self.start_angle = start_angle = 140  # Degrees
+        self.end_angle = end_angle = 400      # Degrees
+
+        self._static_artists = []
 
         # Draw stylized outer ring
-        theta = np.linspace(0, 2*np.pi, 200)
-        r = np.ones_like(theta) * 0.9
-        self.ax.plot(theta, r, color='#143062', linewidth=1.5, alpha=0.5)
+        self._static_artists += ax.plot(_THETA_FULL, _R_FULL, color='#143062', linewidth=1.5, alpha=0.5)
 
         # Draw background arc
-        theta = np.linspace(np.radians(start_angle), np.radians(end_angle), 100)
-        arc_r = np.ones_like(theta) * 0.82
-        self.ax.plot(theta, arc_r, color='#143062', linewidth=5, alpha=0.3, solid_capstyle='round')
-
-        # Draw multiple value arcs for glow effect
-        if percentage > 0:
-            # Choose color based on value
-            if percentage < 50:
-                arc_color = self.color
-                inner_color = '#00c2ff'
-            elif percentage < 80:
-                arc_color = '#ff9800'
-                inner_color = '#ffba52'
-            else:
-                arc_color = '#f44336'
-                inner_color = '#ff7b73'
-
-            # Create gradient effect with multiple arcs
-            theta = np.linspace(np.radians(start_angle), np.radians(value_angle), 100)
-            arc_r = np.ones_like(theta) * 0.82
-
-            # Glow effect with multiple arcs of decreasing opacity
-            for i, alpha in enumerate([0.1, 0.2, 0.3, 0.5, 0.7, 1.0]):
-                width = 5 - i*0.5
-                if i == 5:  # The main arc
-                    width = 4.5
-                self.ax.plot(theta, arc_r, color=arc_color, linewidth=width, alpha=alpha, 
-                           solid_capstyle='round')
-
-            # Add dot at the end of the arc
-            end_x = 0.82 * np.cos(np.radians(value_angle))
-            end_y = 0.82 * np.sin(np.radians(value_angle))
-
-            # Add glow effect to the dot
-            for s in [12, 8, 5]:
-                self.ax.scatter(np.radians(value_angle), 0.82, s=s, color=arc_color, 
-                              alpha=0.3, zorder=10)
-
-            # Main dot
-            self.ax.scatter(np.radians(value_angle), 0.82, s=30, color=inner_color, 
-                         edgecolor='white', linewidth=0.5, zorder=10)
-
-        # Add percentage value text with futuristic styling
-        percent_text = f"{percentage:.1f}%"
-        self.ax.text(0, 0, percent_text, ha='center', va='center', 
-                    fontsize=18, fontweight='bold', color=self.font_color,
-                    path_effects=[path_effects.withStroke(linewidth=3, foreground=self.bg_color)])
-
-        # Add subtitle text
-        if self.title:
-            self.ax.text(0, -0.3, self.title, ha='center', va='center', 
-                       fontsize=10, color=self.font_color, alpha=0.8)
-
-        # Add tick marks for a futuristic look
+        theta = np.radians(start_angle) + _ARC_STEPS * np.radians(end_angle - start_angle)
+        arc_r = np.full_like(theta, 0.82)
+        self._static_artists += ax.plot(theta, arc_r, color='#143062', linewidth=5, alpha=0.3,
+                                        solid_capstyle='round')
+
+        # Tick marks for a futuristic look, gathered into two collections
+        tick_r_inner = 0.75
+        tick_r_outer = 0.82
+        major_ticks, minor_ticks = [], []
         for angle in range(start_angle, end_angle+1, 20):
             # Skip marks too close to the start/end to avoid clutter
             if abs(angle - start_angle) < 10 or abs(angle - end_angle) < 10:
                 continue
 
-            # Calculate tick position
-            tick_r_inner = 0.75
-            tick_r_outer = 0.82
-
-            # Draw the tick
             theta = np.radians(angle)
-            x_inner = tick_r_inner * np.cos(theta)
-            y_inner = tick_r_inner * np.sin(theta)
-            x_outer = tick_r_outer * np.cos(theta)
-            y_outer = tick_r_outer * np.sin(theta)
 
             # Make ticks that represent 25%, 50%, 75% more prominent
             tick_percent = (angle - start_angle) / (end_angle - start_angle) * 100
             if abs(tick_percent - 25) < 5 or abs(tick_percent - 50) < 5 or abs(tick_percent - 75) < 5:
-                self.ax.plot([theta, theta], [tick_r_inner-0.05, tick_r_outer], 
-                           color='#a0d8ff', linewidth=1.5, alpha=0.7)
+                major_ticks.append([(theta, tick_r_inner-0.05), (theta, tick_r_outer)])
                 # Add percent label
                 r_label = tick_r_inner - 0.12
                 x_label = r_label * np.cos(theta)
                 y_label = r_label * np.sin(theta)
-                self.ax.text(x_label, y_label, f"{int(tick_percent)}%", 
-                           ha='center', va='center', fontsize=7, color=self.font_color, alpha=0.8)
+                self._static_artists.append(
+                    ax.text(x_label, y_label, f"{int(tick_percent)}%",
+                            ha='center', va='center', fontsize=7, color=self.font_color, alpha=0.8))
             else:
-                self.ax.plot([theta, theta], [tick_r_inner, tick_r_outer], 
-                           color='#143062', linewidth=0.8, alpha=0.5)
+                minor_ticks.append([(theta, tick_r_inner), (theta, tick_r_outer)])
+
+        for segments, color, width, alpha in ((minor_ticks, '#143062', 0.8, 0.5),
+                                              (major_ticks, '#a0d8ff', 1.5, 0.7)):
+            ticks = LineCollection(segments, colors=color, linewidths=width, alpha=alpha)
+            ax.add_collection(ticks)
+            self._static_artists.append(ticks)
+
+        # Add subtitle text
+        if self.title:
+            self._static_artists.append(
+                ax.text(0, -0.3, self.title, ha='center', va='center',
+                        fontsize=10, color=self.font_color, alpha=0.8))
+
+        # Value arc samples, rewritten in place on every update
+        self._theta_buf = np.empty_like(_ARC_STEPS)
+        self._arc_r = np.full_like(_ARC_STEPS, 0.82)
+
+        # Glow effect with multiple arcs of decreasing opacity
+        self._glow_lines = []
+        for i, alpha in enumerate([0.1, 0.2, 0.3, 0.5, 0.7, 1.0]):
+            width = 5 - i*0.5
+            if i == 5:  # The main arc
+                width = 4.5
+            line, = ax.plot([], [], color=self.color, linewidth=width, alpha=alpha,
+                            solid_capstyle='round')
+            self._glow_lines.append(line)
+
+        # Glow rings and main dot at the end of the arc
+        self._arc_color = None
+        self._dot_glows = [ax.scatter([], [], s=s, color=self.color, alpha=0.3, zorder=10)
+                           for s in [12, 8, 5]]
+        self._dot = ax.scatter([], [], s=30, color=self.color,
+                               edgecolor='white', linewidth=0.5, zorder=10)
+
+        # Percentage value text with futuristic styling
+        self._pct_text = ax.text(0, 0, "", ha='center', va='center',
+                                 fontsize=18, fontweight='bold', color=self.font_color,
+                                 path_effects=[path_effects.withStroke(linewidth=3, foreground=self.bg_color)])
 
         # Set limits
-        self.ax.set_ylim(0, 1)
+        ax.set_ylim(0, 1)
 
-        # Draw the plot
-        self.canvas.draw()
+    def update_data(self, value):
+        """Update the chart with a new value"""
+        value = min(value, self.max_value)
+        # A repeated value (e.g. while the dashboard is paused) would render the same frame
+        if value == self.value:
+            return
+        self.value = value
+
+        # Render on the worker thread once the batch is flushed
+        self._pending_draw = True
+        if not self.defer_draw:
+            self.flush()
+
+    def flush(self):
+        """Hand the render held back while defer_draw was set to the render thread"""
+        if self._pending_draw:
+            self._pending_draw = False
+            self._requested_seq += 1
+            put_latest(self._render_q, (self._requested_seq, self.value, self._size))
+            if self._drain_id is None:
+                self._drain_id = self.canvas_widget.after(33, self._drain)
+
+    def _on_resize(self, event):
+        """Re-render at the widget's new size"""
+        if (event.width, event.height) != self._size and event.width > 1 and event.height > 1:
+            self._size = (event.width, event.height)
+            self._pending_draw = True
+            if not self.defer_draw:
+                self.flush()
+
+    def _on_destroy(self, event):
+        """Stop polling and let the render thread exit"""
+        self._closed = True
+        put_latest(self._render_q, None)
+
+    def _render_loop(self):
+        """Render requested values with Agg and queue each frame as PPM data"""
+        while True:
+            request = self._render_q.get()
+            if request is None:
+                return
+            seq, value, (width, height) = request
+            with self._fig_lock:
+                if self.fig.bbox.size.tolist() != [width, height]:
+                    self.fig.set_size_inches(width / self.dpi, height / self.dpi)
+                self._apply_value(value)
+                self.canvas.draw()
+                rgba = np.asarray(self.canvas.buffer_rgba())
+            frame = b'P6 %d %d 255\n' % (rgba.shape[1], rgba.shape[0]) + rgba[..., :3].tobytes()
+            put_latest(self._frame_q, (seq, frame))
+
+    def _drain(self):
+        """Show the latest finished frame, if any, and poll again until the newest request is shown"""
+        self._drain_id = None
+        if self._closed:
+            return
+        try:
+            self._shown_seq, frame = self._frame_q.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            self._photo.configure(data=frame, format='PPM')
+        if self._shown_seq < self._requested_seq:
+            self._drain_id = self.canvas_widget.after(33, self._drain)
+
+    def _apply_value(self, value):
+        """Move the value artists to a new value (render thread only)"""
+        percentage = (value / self.max_value) * 100
+
+        # Calculate angles
+        start_angle = self.start_angle
+        value_angle = start_angle + (self.end_angle - start_angle) * (percentage / 100)
+
+        # Choose color based on value
+        if percentage < 50:
+            arc_color = self.color
+            inner_color = '#00c2ff'
+        elif percentage < 80:
+            arc_color = '#ff9800'
+            inner_color = '#ffba52'
+        else:
+            arc_color = '#f44336'
+            inner_color = '#ff7b73'
+
+        # Recolor only when the value crosses into another band
+        if arc_color != self._arc_color:
+            self._arc_color = arc_color
+            for artist in self._glow_lines + self._dot_glows:
+                artist.set_color(arc_color)
+            self._dot.set_facecolor(inner_color)
+
+        # Move the glow arcs and end dot to the new value; all six arcs share one path
+        visible = percentage > 0
+        theta = np.multiply(_ARC_STEPS, np.radians(value_angle - start_angle), out=self._theta_buf)
+        theta += np.radians(start_angle)
+        for line in self._glow_lines:
+            line.set_data(theta, self._arc_r)
+            line.set_visible(visible)
+
+        end_point = [[np.radians(value_angle), 0.82]]
+        for dot in self._dot_glows + [self._dot]:
+            dot.set_offsets(end_point)
+            dot.set_visible(visible)
+
+        self._pct_text.set_text(f"{percentage:.1f}%")
 
     def pack(self, **kwargs):
         """Pack the chart widget"""
@@ -657,11 +1215,13 @@ class FuturisticGaugeChart:
 class NetworkData:
     """Class for handling network data with binary auth logic"""
     def __init__(self):
-        # Data storage
-        self.network_traffic = []
-        self.system_load = []
-        self.auth_status = []  # List to track authorized/unauthorized access counts
-        self.timestamps = []
+        # Data storage - bounded, so a long-running dashboard doesn't keep growing
+        self.system_load = deque(maxlen=60)
+        self.auth_status = deque(maxlen=60)  # Authorized/unauthorized access counts per tick
+        self._auth_status_sums = [0, 0]      # Running totals of both columns of auth_status
+        self.timestamps = deque(maxlen=60)
+        self._last_minute = -1               # Epoch minute of the cached '%H:%M' label
+        self._minute_label = ''
         
         # Serial communication
         self.serial_port = None
@@ -669,6 +1229,9 @@ class NetworkData:
         self.serial_thread = None
         self.running = True
 
+        # Guards device/connection state shared by the serial reader and update_data
+        self.lock = threading.Lock()
+
         # Initialize counters
         self.total_authorized = 0
         self.total_unauthorized = 0
@@ -690,17 +1253,26 @@ class NetworkData:
         self.total_authorized = 0
         self.total_unauthorized = 0
 
+        # Bumped by every update_data call, so consumers can tell a new snapshot from a repeat
+        self.version = 0
+
         # Pause state - when True, the data generation is paused
         self.paused = False
         self._selected_device = None  # Store currently selected device index
 
         # Common protocols, ports and destinations
-        self.protocols = ["TCP", "UDP", "HTTP", "HTTPS", "DNS", "FTP", "SSH"]
-        self.common_ports = [80, 443, 22, 21, 53, 8080, 3306, 5432, 25, 110]
-        self.destinations = [
+        self.protocols = ("TCP", "UDP", "HTTP", "HTTPS", "DNS", "FTP", "SSH")
+        self.common_ports = (80, 443, 22, 21, 53, 8080, 3306, 5432, 25, 110)
+        self.destinations = (
             "10.0.0.1", "172.16.0.5", "192.168.10.25", "10.10.10.1", 
             "8.8.8.8", "1.1.1.1", "204.152.189.116", "13.107.21.200"
-        ]
+        )
+        self._n_proto = len(self.protocols)
+        self._n_ports = len(self.common_ports)
+        self._n_dest = len(self.destinations)
+
+        # Single random stream shared by all simulated updates
+        self.rng = np.random.default_rng()
 
         # Device data for 7 devices
         self.devices = [
@@ -713,38 +1285,89 @@ class NetworkData:
             {"name": "Device 7", "ip": "192.168.1.106", "traffic": [0], "connections": []}
         ]
 
-        # System load for 3 lines
-        self.load_values = [
-            {'value': 150, 'direction': 1},  # 1m
-            {'value': 180, 'direction': 1},  # 5m
-            {'value': 120, 'direction': 1}   # 15m
-        ]
+        # System load for 3 lines (1m, 5m, 15m) and the direction each is trending
+        self.load_values = np.array([150.0, 180.0, 120.0])
+        self.load_directions = np.ones(3)
+
+        # Per-device traffic history ring. Every sample is written twice, N apart, so the
+        # latest N samples are always one contiguous slice that charts can use as-is
+        self.history_len = 30
+        self._traffic_buf = np.zeros((len(self.devices), 2 * self.history_len), dtype=np.float32)
+        self._traffic_pos = 0
+        self._traffic_count = 0
 
         # Initialize with some data
         self._generate_initial_data()
 
+    def latest(self, n=None):
+        """The last n traffic samples per device (devices x n) as a view into the ring"""
+        count = self._traffic_count if n is None else min(n, self._traffic_count)
+        end = self._traffic_pos + self.history_len
+        return self._traffic_buf[:, end - count:end]
+
     def _generate_initial_data(self):
         """Initialize with some data"""
         timestamp = time.strftime('%H:%M')
         self.timestamps.append(timestamp)
 
-        # Initialize empty device connections
+        # Initialize empty device connection tables, each indexed by (destination, protocol, port)
+        self._device_by_ip = {device["ip"]: device for device in self.devices}
         for device in self.devices:
-            device["connections"] = []
+            device["conn_buf"] = np.zeros(16, dtype=_CONN_DTYPE)
+            device["connections"] = device["conn_buf"][:0]
+            device["conn_index"] = {}
+            # Bumped whenever a connection is added or evicted, so the UI can tell
+            # whether its per-row caches still describe this table
+            device["version"] = 0
+
+        # Device labels never change, so every tick hands out the same lists
+        self._device_names = [device["name"] for device in self.devices]
+        self._device_ips = [device["ip"] for device in self.devices]
+
+        # Per-device connection views handed to the UI, rebuilt only when a table is re-sliced
+        self._connections_view = []
+        self._conn_dirty = True
+
+    def _index_connections(self, device):
+        """Rebuild a device's connection key -> row index after its table was compacted"""
+        conns = device["connections"]
+        keys = zip(conns["destination"].tolist(), conns["protocol"].tolist(), conns["port"].tolist())
+        device["conn_index"] = {key: row for row, key in enumerate(keys)}
+
+    def _add_connection(self, device, row):
+        """Append a row to a device's connection table, growing the buffer when full"""
+        n = len(device["connections"])
+        buf = device["conn_buf"]
+        if n == len(buf):
+            buf = np.zeros(2 * n, dtype=_CONN_DTYPE)
+            buf[:n] = device["conn_buf"]
+            device["conn_buf"] = buf
+        _, destination, protocol, port = row[:4]
+        buf[n] = row + (f"{protocol} → {destination}:{port}",)
+        device["connections"] = buf[:n + 1]
+        device["version"] += 1
+        self._conn_dirty = True
 
     def _update_connection_details(self):
         """Update connection details for active devices"""
-        # Clean up old connections and update stats
-        current_time = time.time()
-        for device in self.devices:
-            # Update existing connections
-            for conn in device["connections"]:
-                conn["duration"] = current_time - conn["created"]
-                # Randomly update bytes for active connections
-                if conn["status"] == "ACTIVE":
-                    conn["bytes_sent"] += random.randint(1000, 5000)
-                    conn["bytes_received"] += random.randint(500, 3000)
-                    conn["packets"] += random.randint(1, 5)
+        # Durations are derived from 'created' when shown, so only the counters move
+        active = [(device["connections"], np.flatnonzero(device["connections"]["active"]))
+                  for device in self.devices]
+        k = sum(len(idx) for _, idx in active)
+        if not k:
+            return
+
+        # Randomly update bytes for every active connection, one draw per field for all devices
+        sent = self.rng.integers(1000, 5001, k, dtype=np.uint64)
+        received = self.rng.integers(500, 3001, k, dtype=np.uint64)
+        packets = self.rng.integers(1, 6, k, dtype=np.uint32)
+        start = 0
+        for conns, idx in active:
+            end = start + len(idx)
+            if end > start:
+                _bump_active(conns["bytes_sent"], conns["bytes_received"], conns["packets"], idx,
+                             sent[start:end], received[start:end], packets[start:end])
+            start = end
 
     def start_serial_capture(self, port, baud_rate=115200):
         """Start serial data capture"""
@@ -776,8 +1399,12 @@ class NetworkData:
         while self.serial_connected and self.serial_port:
             try:
                 if self.serial_port.in_waiting:
-                    data = self.serial_port.readline().decode('utf-8').strip()
-                    self.process_serial_data(data)
+                    # Drain whatever burst is buffered and apply it under one lock
+                    lines = [self.serial_port.readline()]
+                    while self.serial_port.in_waiting and len(lines) < 512:
+                        lines.append(self.serial_port.readline())
+                    with self.lock:
+                        self.process_serial_batch(lines)
             except Exception as e:
                 print(f"Serial read error: {e}")
                 self.serial_connected = False
@@ -785,80 +1412,105 @@ class NetworkData:
 
     def process_serial_data(self, data):
         """Process incoming serial data from FPGA"""
-        try:
-            # Parse the serial data (format: source_ip,dest_ip,protocol,port,bytes_sent,bytes_received,status)
-            fields = data.strip().split(',')
-            if len(fields) >= 7:
-                source_ip = fields[0]
-                dest_ip = fields[1]
-                protocol = fields[2]
-                port = int(fields[3])
-                bytes_sent = int(fields[4])
-                bytes_received = int(fields[5])
-                status = fields[6]
-
-                # Find the device
-                for device in self.devices:
-                    if device["ip"] == source_ip:
-                        # Check if traffic is authorized
-                        is_auth = self.is_authorized(source_ip, dest_ip, protocol, port)
-
-                        # Update connection information
-                        found = False
-                        for conn in device["connections"]:
-                            if (conn["destination"] == dest_ip and 
-                                conn["protocol"] == protocol and 
-                                conn["port"] == port):
-                                # Update existing connection
-                                conn["bytes_sent"] = bytes_sent
-                                conn["bytes_received"] = bytes_received
-                                conn["status"] = status
-                                conn["duration"] = time.time() - conn["created"]
-                                found = True
-                                break
-
-                        if not found:
-                            # Create new connection
-                            new_conn = {
-                                "source": source_ip,
-                                "destination": dest_ip,
-                                "protocol": protocol,
-                                "port": port,
-                                "status": status,
-                                "bytes_sent": bytes_sent,
-                                "bytes_received": bytes_received,
-                                "packets": 1,
-                                "created": time.time(),
-                                "duration": 0,
-                                "authorized": is_auth
-                            }
-                            device["connections"].append(new_conn)
-
-                        # Update global stats
-                        if is_auth:
-                            self.total_authorized += 1
-                        else:
-                            self.total_unauthorized += 1
+        if isinstance(data, str):
+            data = data.encode()
+        self.process_serial_batch([data])
+
+    def _parse_serial_line(self, line):
+        """Split one raw serial line into its device and connection fields, or None if it
+        is malformed, from an unknown device, or does not fit the connection table"""
+        # Parse the raw line in one regex pass; text fields are decoded only for known devices
+        m = _SERIAL_LINE.match(line)
+        if m is None:
+            return None
+        source, dest, proto, port, sent, received, state = m.groups()
+
+        # Find the device
+        device = self._device_by_ip.get(source.decode())
+        if device is None:
+            return None
+
+        # Ports above 65535 are rejected: they are not valid ports and the port column is 16-bit
+        port = int(port)
+        if port > 65535:
+            return None
+
+        return (device, sys.intern(dest.decode()), sys.intern(proto.decode()), port,
+                int(sent), int(received), sys.intern(state.decode()))
+
+    def process_serial_batch(self, lines):
+        """Process a burst of serial lines, writing updates back one column at a time"""
+        pending = {}
+        for line in lines:
+            # A bad line is reported and skipped; the rest of the burst still applies
+            try:
+                parsed = self._parse_serial_line(line)
+                if parsed is None:
+                    continue
+                device, dest_ip, protocol, port, bytes_sent, bytes_received, status = parsed
+
+                # Check if traffic is authorized
+                is_auth = self.is_authorized(device["ip"], dest_ip, protocol, port)
+
+                key = (dest_ip, protocol, port)
+                row = device["conn_index"].get(key)
+                if row is None:
+                    # New connections are added immediately so later lines in the burst find them
+                    self._add_connection(device, (
+                        device["ip"], dest_ip, protocol, port, status,
+                        bytes_sent, bytes_received, 1, time.perf_counter(), status == "ACTIVE", is_auth))
+                    device["conn_index"][key] = len(device["connections"]) - 1
+                else:
+                    updates = pending.setdefault(device["ip"], ([], [], [], []))
+                    updates[0].append(row)
+                    updates[1].append(bytes_sent)
+                    updates[2].append(bytes_received)
+                    updates[3].append(status)
+
+                # Update global stats
+                if is_auth:
+                    self.total_authorized += 1
+                else:
+                    self.total_unauthorized += 1
 
-                        break
+            except Exception as e:
+                print(f"Error processing serial data: {e}")
 
-        except Exception as e:
-            print(f"Error processing serial data: {e}")
+        # Fancy assignment keeps the last value for repeated rows, matching line order
+        for ip, (rows, sent, received, status) in pending.items():
+            conns = self._device_by_ip[ip]["connections"]
+            status = np.array(status, dtype=_CONN_DTYPE["status"])
+            conns["bytes_sent"][rows] = sent
+            conns["bytes_received"][rows] = received
+            conns["status"][rows] = status
+            conns["active"][rows] = status == "ACTIVE"
 
     def update_data(self):
         """Update timestamps and clean old connections"""
-        timestamp = time.strftime('%H:%M')
-        self.timestamps.append(timestamp)
-
-        # Remove old timestamps
-        if len(self.timestamps) > 60:
-            self.timestamps.pop(0)
-
-        # Clean old connections (older than 5 minutes)
+        self.version += 1
+
+        # Wall clock for the minute label only; connection ages use the monotonic clock
+        now = time.time()
+        minute = int(now) // 60
+        if minute != self._last_minute:
+            # The label only changes once a minute, so strftime runs once a minute too
+            self._last_minute = minute
+            self._minute_label = time.strftime('%H:%M', time.localtime(now))
+        self.timestamps.append(self._minute_label)
+
+        # Clean old connections (older than 5 minutes). Rows are appended in creation
+        # order, so the expired ones are a prefix: checking row 0 is enough when none are
+        cutoff = time.perf_counter() - 300
         for device in self.devices:
-            device["connections"] = [
-                conn for conn in device["connections"] if time.time() - conn["created"] < 300
-            ]
+            conns = device["connections"]
+            if len(conns) and conns["created"][0] <= cutoff:
+                expired = np.searchsorted(conns["created"], cutoff, side='right')
+                n = len(conns) - expired
+                device["conn_buf"][:n] = conns[expired:]
+                device["connections"] = device["conn_buf"][:n]
+                device["version"] += 1
+                self._conn_dirty = True
+                self._index_connections(device)
 
         # Here you would add real traffic monitoring code
         # For now, we'll just keep zero values
@@ -868,18 +1520,18 @@ class NetworkData:
 
         # Extract latest network traffic for each device
         network_values = []
+        total_traffic = 0
+        auth_traffic = 0
         for device in self.devices:
-            traffic = sum([conn["bytes_sent"] + conn["bytes_received"] for conn in device["connections"]])
-            network_values.append(traffic)
+            conns = device["connections"]
+            # Integer sums keep the uint64 byte counters exact (bincount weights would go via float64)
+            traffic = conns["bytes_sent"] + conns["bytes_received"]
+            network_values.append(int(traffic.sum()))
+            total_traffic += network_values[-1]
+            auth_traffic += int(traffic[conns["authorized"]].sum())
 
         # Calculate auth percentages based on actual traffic
-        total_traffic = sum(network_values)
         if total_traffic > 0:
-            auth_traffic = sum([conn["bytes_sent"] + conn["bytes_received"] 
-                              for device in self.devices 
-                              for conn in device["connections"] 
-                              if conn.get("authorized", True)])
-            
             self.current_auth_percent = (auth_traffic / total_traffic) * 100
             self.current_unauth_percent = 100 - self.current_auth_percent
         else:
@@ -887,62 +1539,66 @@ class NetworkData:
             self.current_unauth_percent = 0
 
         # Store auth status for historical data
-        self.auth_status.append([self.total_authorized, self.total_unauthorized])
-        if len(self.auth_status) > 60:
-            self.auth_status.pop(0)
+        # Keep the window totals current: add the new entry, subtract the one it evicts
+        entry = [self.total_authorized, self.total_unauthorized]
+        old = self.auth_status[0] if len(self.auth_status) == self.auth_status.maxlen else (0, 0)
+        self.auth_status.append(entry)
+        self._auth_status_sums[0] += entry[0] - old[0]
+        self._auth_status_sums[1] += entry[1] - old[1]
 
-        # Update system load (3 lines, wandering with trends)
-        current_loads = []
-        for i, load in enumerate(self.load_values):
-            # Change direction occasionally
-            if random.random() < 0.1:
-                load['direction'] *= -1
+        # Update system load (3 lines, wandering with trends), one draw for all lines
+        flips, steps = self.rng.random((2, 3))
 
-            # Update value with trend
-            change = (random.random() * 15) * load['direction']
-            load['value'] += change
+        # Change direction occasionally
+        self.load_directions[flips < 0.1] *= -1
 
-            # Keep within reasonable bounds (100-300%)
-            load['value'] = max(100, min(300, load['value']))
-            current_loads.append(load['value'])
+        # Update value with trend, keeping within reasonable bounds (100-300%)
+        self.load_values += steps * 15 * self.load_directions
+        np.clip(self.load_values, 100, 300, out=self.load_values)
+        current_loads = self.load_values.tolist()
 
         self.system_load.append(current_loads)
-        if len(self.system_load) > 60:
-            self.system_load.pop(0)
 
-        # Extract latest network traffic for each device
-        network_values = []
-        for device in self.devices:
-            traffic = sum([conn["bytes_sent"] + conn["bytes_received"] for conn in device["connections"]])
-            network_values.append(traffic)
+        # Record the traffic sample in the history ring
+        n = self.history_len
+        pos = self._traffic_pos
+        self._traffic_buf[:, pos] = network_values
+        self._traffic_buf[:, pos + n] = network_values
+        self._traffic_pos = (pos + 1) % n
+        self._traffic_count = min(self._traffic_count + 1, n)
+        # Copied: the snapshot is read on the Tk thread while this thread keeps writing the ring
+        traffic_history = self.latest().copy()
 
         # Extract latest auth status data
         auth_data = self.auth_status[-1] if self.auth_status else [0, 0]
 
-        # Extract connection details for each device
-        connection_details = []
-        for device in self.devices:
-            connection_details.append(device["connections"])
+        # Extract connection details for each device. The views see in-place updates,
+        # so the list only changes when a connection was added or evicted
+        if self._conn_dirty:
+            self._connections_view = [device["connections"] for device in self.devices]
+            self._conn_dirty = False
+        connection_details = self._connections_view
 
         # Calculate totals for hover displays
-        total_auth_requests = sum([data[0] for data in self.auth_status])
-        total_unauth_requests = sum([data[1] for data in self.auth_status])
+        total_auth_requests, total_unauth_requests = self._auth_status_sums
         total_security_alerts = total_unauth_requests
 
-        # Create response dictionary
+        # Create response dictionary (tables are shared references, not copies)
         response = {
             'network_traffic': network_values,
+            'network_traffic_total': total_traffic,
             'auth_percent': self.current_auth_percent,
             'unauth_percent': self.current_unauth_percent,
             'auth_counts': auth_data,
-            'network_history': self.network_traffic,
+            'traffic_history': traffic_history,
             'system_load': self.system_load[-1],
             'timestamp': self.timestamps[-1],
             'connections': connection_details,
-            'device_names': [d["name"] for d in self.devices],
-            'device_ips': [d["ip"] for d in self.devices],
+            'device_names': self._device_names,
+            'device_ips': self._device_ips,
             'paused': self.paused,
             'selected_device': self.selected_device,
+            'version': self.version,
 
             # Add totals for hover displays
             'total_auth_requests': total_auth_requests,
@@ -968,17 +1624,18 @@ class NetworkData:
 
     def is_authorized(self, source_ip, dest_ip, protocol, port):
         """Simulate authorization logic based on source IP and port"""
-        # Simple authorization rule:  even ports are authorized
-        if port % 2 == 0:
-            return True  # Authorized
-        else:
-            return False # Unauthorized
+        # Simple authorization rule: even ports are authorized, precomputed per port.
+        # Anything outside 0-65535 is not a valid port and is never authorized
+        if 0 <= port < len(_AUTH_TABLE):
+            return bool(_AUTH_TABLE[port])
+        return False
 
 
 class FuturisticNetworkDashboard:
     def __init__(self, root):
         self.root = root
         self.running = True
+        self._last_clock_sec = -1
 
         # Configure main window
         root.title("Futuristic Network Monitoring Dashboard")
@@ -987,6 +1644,37 @@ class FuturisticNetworkDashboard:
         root.configure(bg="#080f1c")  # Dark blue-black for futuristic feel
         root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
+        # Track whether the window is mapped so update_ui can idle while minimized
+        self._visible = True
+        root.bind("<Map>", self._on_map, add="+")
+        root.bind("<Unmap>", self._on_unmap, add="+")
+
+        # Device details popup, None while closed
+        self.detail_window = None
+
+        # Pending debounced calls, keyed by name
+        self._hover_jobs = {}
+
+        # Hover label texts waiting for the next flush, and the scheduled flush
+        self._hover_pending = {}
+        self._hover_flush_id = None
+        # Text each info label currently shows (they all start blank)
+        self._hover_shown = {}
+
+        # Set while update_ui is pushing data with chart redraws held back
+        self._batching = False
+
+        # Charts take data every tick but are only redrawn every _draw_interval seconds
+        self._draw_interval = 0.5
+        self._last_draw = 0.0
+
+        # Hover label texts, formatted once per data update in update_ui
+        self._network_info_text = ""
+        self._auth_info_text = ""
+        self._auth_gauge_info_text = ""
+        self._unauth_info_text = ""
+        self._unauth_gauge_info_text = ""
+
         # Create data simulator
         self.node_data = NetworkData()
 
@@ -1017,6 +1705,13 @@ class FuturisticNetworkDashboard:
             '#ff16e9'   # Hot Pink
         ]
 
+        # Shared styling for every chart and gauge
+        self._chart_style = types.SimpleNamespace(
+            bg=self.colors['chart_bg'],
+            grid=self.colors['grid'],
+            fg=self.colors['text']
+        )
+
         # UI components
         self.main_frame = None
         self.header_frame = None
@@ -1034,13 +1729,26 @@ class FuturisticNetworkDashboard:
         self.style = ttk.Style()
         self._setup_styles()
 
+        # Fonts for the device details window, created once and shared by every row
+        self._f_bold10 = tkFont.Font(family='Segoe UI', size=10, weight='bold')
+        self._f10 = tkFont.Font(family='Segoe UI', size=10)
+        self._f9 = tkFont.Font(family='Segoe UI', size=9)
+
         # Setup UI
         self.setup_ui()
 
-        # Start the update loop
+        # Data is polled on a worker thread; update_ui picks up the newest snapshot
+        self._tick_interval = 0.1
+        self._data_q = queue.Queue(maxsize=4)
+        self._data_thread = threading.Thread(target=self._data_worker, daemon=True)
+        self._data_thread.start()
+
+        # Start the update loop (every 100ms for more real-time feel)
+        self._next_tick = time.monotonic()
         self.update_ui()
 
-        # Initialize auto-save
+        # Initialize auto-save; exports are written one at a time on a dedicated I/O thread
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="export")
         self._export_data()
 
     def _setup_styles(self):
@@ -1063,6 +1771,14 @@ class FuturisticNetworkDashboard:
                           background=self.colors['bg'], 
                           foreground=self.colors['highlight'],
                           font=('Segoe UI', 9))
+        self.style.configure('DetailTitle.TLabel', 
+                          background=self.colors['header_bg'], 
+                          foreground=self.colors['text'],
+                          font=('Segoe UI', 14, 'bold'))
+        self.style.configure('DetailSection.TLabel', 
+                          background=self.colors['bg'], 
+                          foreground=self.colors['highlight'],
+                          font=('Segoe UI', 11, 'bold'))
 
     def setup_ui(self):
         """Set up the main UI components"""
@@ -1119,6 +1835,8 @@ class FuturisticNetworkDashboard:
 
         # Create the dropdown with all devices
         device_options = ["All Devices"] + [f"Device {i+1}" for i in range(7)]
+        self._device_idx_map = {name: i for i, name in enumerate(device_options[1:])}
+        self._device_idx_map["All Devices"] = None
         self.device_dropdown = ttk.Combobox(device_frame, 
                                          textvariable=self.device_var,
                                          values=device_options,
@@ -1169,11 +1887,12 @@ class FuturisticNetworkDashboard:
                                       command=self._toggle_serial_connection)
         self.connect_button.pack(side=tk.LEFT, padx=5)
 
-        # Digital clock display
+        # Digital clock display (fixed width so ticking digits never reflow the header)
         self.time_display = ttk.Label(time_frame, 
                                    text=time.strftime("%H:%M:%S"), 
                                    style='Header.TLabel',
-                                   font=('-apple-system', 12, 'bold'),
+                                   width=8,
+                                   font=('Courier', 12, 'bold'),
                                    foreground=self.colors['highlight'])
         self.time_display.pack(side=tk.RIGHT, padx=10)
 
@@ -1182,11 +1901,14 @@ class FuturisticNetworkDashboard:
 
     def _update_clock(self):
         """Update the digital clock with accurate time"""
-        current_time = time.strftime("%H:%M:%S")
-        self.time_display.config(text=current_time)
+        # One clock read drives both the label and the next wake-up
+        now = time.time()
+        sec = int(now)
+        if sec != self._last_clock_sec:
+            self._last_clock_sec = sec
+            self.time_display.config(text=time.strftime("%H:%M:%S", time.localtime(now)))
         # Schedule the update to occur precisely at the next second
-        msecs_remaining = 1000 - (int(time.time() * 1000) % 1000)
-        self.root.after(msecs_remaining, self._update_clock)
+        self.root.after(1000 - int((now - sec) * 1000), self._update_clock)
 
     def _get_available_ports(self):
         """Get list of available COM ports"""
@@ -1259,9 +1981,8 @@ class FuturisticNetworkDashboard:
                                          foreground=self.colors['highlight'])
         self.network_info_label.pack(side=tk.RIGHT, padx=10)
 
-        # Bind hover events to the title frame
-        title_frame.bind("<Enter>", self._on_network_hover)
-        title_frame.bind("<Leave>", self._on_network_leave)
+        # Hover anywhere over the title or chart
+        self._bind_hover(network_frame, self._on_network_hover, self._on_network_leave)
 
         # Create chart
         self.network_chart = FuturisticLineChart(
@@ -1269,18 +1990,14 @@ class FuturisticNetworkDashboard:
             "Traffic Rate",
             ["Device 1", "Device 2", "Device 3", "Device 4", "Device 5", "Device 6", "Device 7"],
             self.device_colors,
-            bg_color=self.colors['chart_bg'],
-            grid_color=self.colors['grid'],
+            style=self._chart_style,
             width=500,
             height=200,
-            font_color=self.colors['text'],
-            show_hover_values=True  # Enable hover values for Network chart
+            show_hover_values=True,  # Enable hover values for Network chart
+            render_every=2  # Data arrives every 100ms; 5 frames a second is plenty
         )
         self.network_chart.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-
-        # Bind hover events to the chart canvas to pause traffic
-        self.network_chart.canvas.get_tk_widget().bind("<Enter>", self._on_network_hover)
-        self.network_chart.canvas.get_tk_widget().bind("<Leave>", self._on_network_leave)
+        self.network_chart.app = self
 
         # Bind click events to select devices
         self.network_chart.canvas.mpl_connect('button_press_event', self.network_chart.on_click)
@@ -1289,6 +2006,7 @@ class FuturisticNetworkDashboard:
 
     def _create_auth_chart(self):
         """Create the Network Access Monitor chart"""
+        c = self.colors
         auth_frame = ttk.Frame(self.charts_frame, style='TFrame')
         auth_frame.grid(row=1, column=0, columnspan=2, sticky="nsew", padx=8, pady=8)
 
@@ -1302,34 +2020,28 @@ class FuturisticNetworkDashboard:
 
         # Info label for hover stats (initially empty)
         self.auth_info_label = ttk.Label(title_frame, text="", style='Subtitle.TLabel',
-                                       foreground=self.colors['highlight'])
+                                       foreground=c['highlight'])
         self.auth_info_label.pack(side=tk.RIGHT, padx=10)
 
-        # Bind hover events to the title frame
-        title_frame.bind("<Enter>", self._on_auth_hover)
-        title_frame.bind("<Leave>", self._on_auth_leave)
+        # Hover anywhere over the title or chart
+        self._bind_hover(auth_frame, self._on_auth_hover, self._on_auth_leave)
 
         # Create chart for network access monitoring
-        self.auth_chart = FuturisticLineChart(
+        self.auth_chart = FastLineCanvas(
             auth_frame,
             "Access Requests",
             ["Authorized", "Unauthorized"],
-            [self.colors['green'], self.colors['orange']],  # Green for authorized, Orange for unauthorized
-            bg_color=self.colors['chart_bg'],
-            grid_color=self.colors['grid'],
+            [c['green'], c['orange']],  # Green for authorized, Orange for unauthorized
+            style=self._chart_style,
             width=750,
             height=200,
-            font_color=self.colors['text'],
             show_hover_values=False  # Disable hover values for Auth chart
         )
         self.auth_chart.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
-        # Bind hover events to the chart canvas
-        self.auth_chart.canvas.get_tk_widget().bind("<Enter>", self._on_auth_hover)
-        self.auth_chart.canvas.get_tk_widget().bind("<Leave>", self._on_auth_leave)
-
     def _create_auth_gauge(self):
         """Create Authorized Access gauge"""
+        c = self.colors
         auth_gauge_frame = ttk.Frame(self.charts_frame, style='TFrame')
         auth_gauge_frame.grid(row=1, column=2, sticky="nsew", padx=8, pady=8)
 
@@ -1343,31 +2055,26 @@ class FuturisticNetworkDashboard:
 
         # Info label for hover stats (initially empty)
         self.auth_gauge_info_label = ttk.Label(title_frame, text="", style='Subtitle.TLabel',
-                                           foreground=self.colors['highlight'])
+                                           foreground=c['highlight'])
         self.auth_gauge_info_label.pack(side=tk.RIGHT, padx=10)
 
-        # Bind hover events to the title frame
-        title_frame.bind("<Enter>", self._on_auth_gauge_hover)
-        title_frame.bind("<Leave>", self._on_auth_gauge_leave)
+        # Hover anywhere over the title or chart
+        self._bind_hover(auth_gauge_frame, self._on_auth_gauge_hover, self._on_auth_gauge_leave)
 
         # Create gauge
         self.auth_gauge = FuturisticGaugeChart(
             auth_gauge_frame,
             "Authorization Rate",
-            bg_color=self.colors['chart_bg'],
-            color=self.colors['green'],
+            style=self._chart_style,
+            color=c['green'],
             width=300,
-            height=250,
-            font_color=self.colors['text']
+            height=250
         )
         self.auth_gauge.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
-        # Bind hover events to the gauge canvas
-        self.auth_gauge.canvas.get_tk_widget().bind("<Enter>", self._on_auth_gauge_hover)
-        self.auth_gauge.canvas.get_tk_widget().bind("<Leave>", self._on_auth_gauge_leave)
-
     def _create_unauth_chart(self):
         """Create the Security Alerts chart"""
+        c = self.colors
         unauth_frame = ttk.Frame(self.charts_frame, style='TFrame')
         unauth_frame.grid(row=2, column=0, columnspan=2, sticky="nsew", padx=8, pady=8)
 
@@ -1377,39 +2084,33 @@ class FuturisticNetworkDashboard:
 
         # Title with alert icon
         title_label = ttk.Label(title_frame, text="⚠ SECURITY ALERTS", style='Title.TLabel',
-                            foreground=self.colors['orange'])
+                            foreground=c['orange'])
         title_label.pack(side=tk.LEFT)
 
         # Info label for hover stats (initially empty)
         self.unauth_info_label = ttk.Label(title_frame, text="", style='Subtitle.TLabel',
-                                        foreground=self.colors['orange'])
+                                        foreground=c['orange'])
         self.unauth_info_label.pack(side=tk.RIGHT, padx=10)
 
-        # Bind hover events to the title frame
-        title_frame.bind("<Enter>", self._on_unauth_hover)
-        title_frame.bind("<Leave>", self._on_unauth_leave)
+        # Hover anywhere over the title or chart
+        self._bind_hover(unauth_frame, self._on_unauth_hover, self._on_unauth_leave)
 
         # Create chart for unauthorized access monitoring
-        self.unauth_chart = FuturisticLineChart(
+        self.unauth_chart = FastLineCanvas(
             unauth_frame,
             "Alert Count",
             ["Security Alerts"],
-            [self.colors['orange']],  # Orange for alerts
-            bg_color=self.colors['chart_bg'],
-            grid_color=self.colors['grid'],
+            [c['orange']],  # Orange for alerts
+            style=self._chart_style,
             width=750,
             height=200,
-            font_color=self.colors['text'],
             show_hover_values=False  # Disable hover values for Security Alerts chart
         )
         self.unauth_chart.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
-        # Bind hover events to the chart canvas
-        self.unauth_chart.canvas.get_tk_widget().bind("<Enter>", self._on_unauth_hover)
-        self.unauth_chart.canvas.get_tk_widget().bind("<Leave>", self._on_unauth_leave)
-
     def _create_unauth_gauge(self):
         """Create Unauthorized Access gauge"""
+        c = self.colors
         unauth_gauge_frame = ttk.Frame(self.charts_frame, style='TFrame')
         unauth_gauge_frame.grid(row=2, column=2, sticky="nsew", padx=8, pady=8)
 
@@ -1419,220 +2120,485 @@ class FuturisticNetworkDashboard:
 
         # Title with alert icon
         title_label = ttk.Label(title_frame, text="⚠ UNAUTHORIZED ACCESS", 
-                            style='Title.TLabel', foreground=self.colors['orange'])
+                            style='Title.TLabel', foreground=c['orange'])
         title_label.pack(side=tk.LEFT)
 
         # Info label for hover stats (initially empty)
         self.unauth_gauge_info_label = ttk.Label(title_frame, text="", style='Subtitle.TLabel',
-                                             foreground=self.colors['orange'])
+                                             foreground=c['orange'])
         self.unauth_gauge_info_label.pack(side=tk.RIGHT, padx=10)
 
-        # Bind hover events to the title frame
-        title_frame.bind("<Enter>", self._on_unauth_gauge_hover)
-        title_frame.bind("<Leave>", self._on_unauth_gauge_leave)
+        # Hover anywhere over the title or chart
+        self._bind_hover(unauth_gauge_frame, self._on_unauth_gauge_hover, self._on_unauth_gauge_leave)
 
         # Create gauge
         self.unauth_gauge = FuturisticGaugeChart(
             unauth_gauge_frame,
             "Alert Level",
-            bg_color=self.colors['chart_bg'],
-            color=self.colors['orange'],  # Orange for unauthorized
+            style=self._chart_style,
+            color=c['orange'],  # Orange for unauthorized
             width=300,
-            height=250,
-            font_color=self.colors['text']
+            height=250
         )
         self.unauth_gauge.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
-        # Bind hover events to the gauge canvas
-        self.unauth_gauge.canvas.get_tk_widget().bind("<Enter>", self._on_unauth_gauge_hover)
-        self.unauth_gauge.canvas.get_tk_widget().bind("<Leave>", self._on_unauth_gauge_leave)
+    def _bind_hover(self, frame, on_enter, on_leave):
+        """Bind hover callbacks once on a chart's outer frame"""
+        prefix = str(frame) + "."
+
+        def leave(event):
+            # Moving onto a child widget also sends <Leave> to the frame - ignore it
+            inside = frame.winfo_containing(event.x_root, event.y_root)
+            if inside is not None and (inside is frame or str(inside).startswith(prefix)):
+                return
+            on_leave(event)
+
+        frame.bind("<Enter>", on_enter)
+        frame.bind("<Leave>", leave)
+
+    def _on_map(self, event):
+        """Window was restored - resume chart updates"""
+        if event.widget is self.root:
+            self._visible = True
+
+    def _on_unmap(self, event):
+        """Window was minimized - skip chart updates until it is shown again"""
+        if event.widget is self.root:
+            self._visible = False
+
+    def _data_worker(self):
+        """Poll node_data off the Tk thread and queue each snapshot for update_ui"""
+        while self.running:
+            with self.node_data.lock:
+                data = self.node_data.update_data()
+            # If the UI is behind, drop the oldest snapshot rather than the newest
+            put_latest(self._data_q, data)
+            time.sleep(self._tick_interval)
+
+    @contextmanager
+    def _batch_redraw(self):
+        """Hold back chart redraws inside the block; flush them in one idle pass if a redraw is due"""
+        now = time.monotonic()
+        draw = now - self._last_draw >= self._draw_interval
+        if draw:
+            self._last_draw = now
+        self._batching = True
+        try:
+            with batched_updates(flush=draw):
+                yield
+        finally:
+            self._batching = False
+            if draw:
+                self.root.update_idletasks()
 
     def update_ui(self):
         """Update the UI with the latest data"""
+        # Nothing on screen to refresh while minimized
+        if not self._visible:
+            self._schedule_next_tick()
+            return
+
         if self.running:
-            # Get the latest data
-            data = self.node_data.update_data()
-
-            # Update Network Traffic chart (all 7 devices) with connection details for hover
-            self.network_chart.update_data(
-                data['network_traffic'], 
-                data['timestamp'],
-                connection_details=data['connections'] if 'connections' in data else None,
-                device_names=data['device_names'] if 'device_names' in data else None,
-                device_ips=data['device_ips'] if 'device_ips' in data else None
-            )
-
-            # Update Auth/Unauth charts
-            self.auth_chart.update_data(data['auth_counts'], data['timestamp'])
-            self.auth_gauge.update_data(data['auth_percent'])
-
-            # Update Unauthorized charts
-            # For the unauth_chart, we're just passing the unauthorized count
-            self.unauth_chart.update_data([data['auth_counts'][1]], data['timestamp'])
-            self.unauth_gauge.update_data(data['unauth_percent'])
-
-        # Schedule the next update (every 100ms for more real-time feel)
-        self.root.after(100, self.update_ui)
+            # Get the newest snapshot from the data worker
+            data = None
+            try:
+                while True:
+                    data = self._data_q.get_nowait()
+            except queue.Empty:
+                pass
+            if data is None:
+                self._schedule_next_tick()
+                return
+            self._format_hover_texts(data)
+
+            # Push all charts first, then redraw them together (at most every _draw_interval)
+            with self._batch_redraw():
+                # Update Network Traffic chart (all 7 devices) with connection details for hover
+                self.network_chart.update_data(
+                    data['network_traffic'], 
+                    data['timestamp'],
+                    connection_details=data['connections'] if 'connections' in data else None,
+                    device_names=data['device_names'] if 'device_names' in data else None,
+                    device_ips=data['device_ips'] if 'device_ips' in data else None,
+                    history=data.get('traffic_history'),
+                    version=data.get('version')
+                )
+
+                # Update Auth/Unauth charts
+                self.auth_chart.update_data(data['auth_counts'], data['timestamp'])
+                self.auth_gauge.update_data(data['auth_percent'])
+
+                # Update Unauthorized charts
+                # For the unauth_chart, we're just passing the unauthorized count
+                self.unauth_chart.update_data([data['auth_counts'][1]], data['timestamp'])
+                self.unauth_gauge.update_data(data['unauth_percent'])
+
+        # Schedule the next update
+        self._schedule_next_tick()
+
+    def _schedule_next_tick(self):
+        """Schedule update_ui on a fixed monotonic cadence so slow ticks don't add drift"""
+        now = time.monotonic()
+        self._next_tick += self._tick_interval
+        if self._next_tick < now:
+            # Fell more than a whole tick behind - resync rather than firing a burst
+            self._next_tick = now
+        delay_ms = max(1, int((self._next_tick - now) * 1000))
+        self.root.after(delay_ms, self.update_ui)
 
     def _on_device_selected(self, event):
         """Handle device selection from dropdown"""
+        # Device index (0-6) for the selected entry, None for "All Devices"
         selected = self.device_var.get()
+        if selected not in self._device_idx_map:
+            return
+        device_idx = self._device_idx_map[selected]
 
-        if selected == "All Devices":
-            # Show all devices, unpause data
-            self.node_data.paused = False
-            self.node_data.selected_device = None
+        # Pause data while a single device is selected
+        self.node_data.paused = device_idx is not None
+        self.node_data.selected_device = device_idx
 
+        if device_idx is None:
             # Close the detail window if it exists
-            if hasattr(self, 'detail_window') and self.detail_window.winfo_exists():
-                self.detail_window.destroy()
+            self._hide_detail_window()
         else:
-            # Extract device index (0-6) from the selected device string
-            try:
-                # Parse "Device X" to get the device index (0-based)
-                device_idx = int(selected.split()[1]) - 1
-                if 0 <= device_idx < 7:
-                    # Pause data and set selected device
-                    self.node_data.paused = True
-                    self.node_data.selected_device = device_idx
-
-                    # Show device details in a popup
-                    self._show_device_details(device_idx)
-            except (ValueError, IndexError):
-                # If the parsing fails, just ignore
-                pass
+            # Show device details in a popup
+            self._show_device_details(device_idx)
 
     def _show_device_details(self, device_idx):
         """Show device details in a popup window"""
-        if not hasattr(self, 'detail_window') or not self.detail_window.winfo_exists():
-            # Create new detail window
-            self.detail_window = tk.Toplevel(self.root)
-            self.detail_window.title(f"Device {device_idx+1} Details")
-            self.detail_window.geometry("500x400")
-            self.detail_window.configure(bg=self.colors['bg'])
-            self.detail_window.transient(self.root)  # Set as transient to main window
-
-            # Get device data
-            device = self.node_data.devices[device_idx]
-            device_name = device["name"]
-            device_ip = device["ip"]
-
-            # Create header with device info
-            header_frame = tk.Frame(self.detail_window, bg=self.colors['header_bg'])
-            header_frame.pack(fill=tk.X, padx=0, pady=0)
-
-            # Device name and IP
-            tk.Label(header_frame, 
-                  text=f"{device_name} ({device_ip})", 
-                  font=('Segoe UI', 14, 'bold'),
-                  bg=self.colors['header_bg'],
-                  fg=self.colors['text']).pack(pady=10)
-
-            # Connection details section
-            details_frame = tk.Frame(self.detail_window, bg=self.colors['bg'])
-            details_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
-
-            # Create connections list
-            conn_frame = tk.Frame(details_frame, bg=self.colors['bg'])
-            conn_frame.pack(fill=tk.BOTH, expand=True, padx=0, pady=10)
-
-            # Header
-            tk.Label(conn_frame, 
-                  text="ACTIVE CONNECTIONS", 
-                  font=('Segoe UI', 11, 'bold'),
-                  bg=self.colors['bg'],
-                  fg=self.colors['highlight']).pack(anchor=tk.W, pady=(0, 10))
-
-            # Create scrollable frame for connections
-            canvas = tk.Canvas(conn_frame, bg=self.colors['bg'], highlightthickness=0)
-            scrollbar = ttk.Scrollbar(conn_frame, orient="vertical", command=canvas.yview)
-            scrollable_frame = tk.Frame(canvas, bg=self.colors['bg'])
-            scrollable_frame.bind(
-                "<Configure>",
-                lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-            )
-
-            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-            canvas.configure(yscrollcommand=scrollbar.set)
-
-            canvas.pack(side="left", fill="both", expand=True)
-            scrollbar.pack(side="right", fill="y")
-
-            # Add connection details
-            if device["connections"]:
-                for i, conn in enumerate(device["connections"]):
-                    # Create connection frame
-                    connection_frame = tk.Frame(scrollable_frame, bg=self.colors['bg'], padx=5, pady=5)
-                    connection_frame.pack(fill=tk.X, pady=5)
-
-                    # Connection header (Protocol and destination)
-                    status_color = self.colors['green'] if conn.get("authorized", True) else self.colors['orange']
-                    conn_header = tk.Frame(connection_frame, bg=self.colors['bg'])
-                    conn_header.pack(fill=tk.X)
-
-                    # Icon based on protocol
-                    icon = "⚡" if conn['protocol'] in ["HTTP", "HTTPS"] else "⟷"
-                    if conn['protocol'] == "SSH":
-                        icon = "🔒"
-                    elif conn['protocol'] == "DNS":
-                        icon = "🔍"
-
-                    tk.Label(conn_header, 
-                          text=f"{icon} {conn['protocol']} → {conn['destination']}:{conn['port']}", 
-                          font=('Segoe UI', 10, 'bold'),
-                          bg=self.colors['bg'],
-                          fg=status_color).pack(side=tk.LEFT)
-
-                    # Status indicator
-                    auth_text = "✓ Authorized" if conn.get("authorized", True) else "⚠ Unauthorized"
-                    tk.Label(conn_header, 
-                          text=auth_text, 
-                          font=('Segoe UI', 9),
-                          bg=self.colors['bg'],
-                          fg=status_color).pack(side=tk.RIGHT)
-
-                    # Connection details
-                    details_text = f"Status: {conn['status']}  |  Duration: {int(conn['duration'])}s\n"
-                    details_text += f"Bytes sent: {self._format_bytes(conn['bytes_sent'])}  |  "
-                    details_text += f"Received: {self._format_bytes(conn['bytes_received'])}  |  "
-                    details_text += f"Packets: {conn['packets']}"
-
-                    tk.Label(connection_frame, 
-                          text=details_text, 
-                          font=('Segoe UI', 9),
-                          bg=self.colors['bg'],
-                          fg=self.colors['text'],
-                          justify=tk.LEFT).pack(anchor=tk.W, pady=(5, 0))
-
-                    # Add separator except for last item
-                    if i < len(device["connections"]) - 1:
-                        separator = tk.Frame(scrollable_frame, height=1, bg=self.colors['grid'])
-                        separator.pack(fill=tk.X, padx=5, pady=5)
-            else:
-                # No connections
-                tk.Label(scrollable_frame, 
-                      text="No active connections", 
-                      font=('Segoe UI', 10),
-                      bg=self.colors['bg'],
-                      fg=self.colors['text']).pack(pady=20)
-
-            # Close button
-            close_button = tk.Button(self.detail_window, 
-                                   text="Close", 
-                                   font=('Segoe UI', 10),
-                                   bg=self.colors['header_bg'],
-                                   fg=self.colors['text'],
-                                   bd=0,
-                                   padx=15,
-                                   pady=5,
-                                   activebackground=self.colors['highlight'],
-                                   activeforeground=self.colors['text'],
-                                   command=lambda: self.detail_window.destroy())
-            close_button.pack(pady=10)
+        if self.detail_window is None:
+            self._build_detail_window()
+        else:
+            # The window is only withdrawn when closed, so reopening reuses its widgets
+            self.detail_window.deiconify()
+        # Showing the same device again with no connection added or evicted changes nothing
+        with self.node_data.lock:
+            sig = (device_idx, self.node_data.devices[device_idx]["version"])
+        if sig != self._detail_sig:
+            self._detail_sig = sig
+            # Row texts formatted for this device stay valid until a connection is added or evicted
+            cached = self._detail_text_cache.get(device_idx)
+            if cached is None or cached[0] != sig:
+                self._detail_text_cache[device_idx] = cached = (sig, {})
+            self._detail_texts = cached[1]
+            self._populate_detail_window(device_idx)
         else:
-            # Update existing window with new device
-            self.detail_window.title(f"Device {device_idx+1} Details")
-            # Update window content here...
+            # Only the counters and ages have moved on since the rows were drawn
+            self._fill_detail_rows(redraw=True)
+
+    def _build_detail_window(self):
+        """Create the device details window; its rows are filled by _populate_detail_window"""
+        c = self.colors
+        self.detail_window = tk.Toplevel(self.root)
+        self.detail_window.geometry("500x400")
+        self.detail_window.configure(bg=c['bg'])
+        self.detail_window.transient(self.root)  # Set as transient to main window
+        self.detail_window.bind("<Destroy>", self._on_detail_window_destroy)
+        self.detail_window.protocol("WM_DELETE_WINDOW", self._hide_detail_window)
+
+        # Create header with device info
+        header_frame = ttk.Frame(self.detail_window, style='Header.TFrame')
+        header_frame.pack(fill=tk.X, padx=0, pady=0)
+
+        # Device name and IP
+        self._detail_title_label = ttk.Label(header_frame, text="", style='DetailTitle.TLabel')
+        self._detail_title_label.pack(pady=10)
+
+        # Connection details section
+        details_frame = ttk.Frame(self.detail_window, style='TFrame')
+        details_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
+
+        # Create connections list
+        conn_frame = ttk.Frame(details_frame, style='TFrame')
+        conn_frame.pack(fill=tk.BOTH, expand=True, padx=0, pady=10)
+
+        # Header
+        ttk.Label(conn_frame, text="ACTIVE CONNECTIONS",
+                  style='DetailSection.TLabel').pack(anchor=tk.W, pady=(0, 10))
+
+        # Scrollable canvas; each connection is drawn as a few text items on it. Scroll
+        # units are whole rows, like a table, so the view always starts on a row boundary
+        self._detail_row_height = 72
+        canvas = tk.Canvas(conn_frame, bg=c['bg'], highlightthickness=0,
+                           yscrollincrement=self._detail_row_height)
+        scrollbar = ttk.Scrollbar(conn_frame, orient="vertical", command=self._on_detail_scroll)
+        canvas.configure(yscrollcommand=scrollbar.set)
+
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        canvas.bind("<Configure>", self._on_detail_canvas_resize)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            canvas.bind(sequence, self._on_detail_wheel)
+
+        # Only the rows in view exist: a small pool of rows is moved onto whichever
+        # connections are scrolled into view, so the item count never follows N
+        self._detail_canvas = canvas
+        self._detail_width = 450
+        self._detail_view_height = 250
+        self._detail_height = self._detail_row_height
+        self._detail_region = None
+        self._detail_rows = []
+        self._detail_device = None
+        self._detail_sig = None
+        # Per device: (add/evict signature, {row: static texts}), and the shown device's texts.
+        # Status, counters and durations change every tick, so they are formatted when drawn
+        self._detail_text_cache = {}
+        self._detail_texts = {}
+        self._detail_version = None
+        # Status colour and text for each value of a connection's 'authorized' flag
+        self._detail_auth_styles = {True: (c['green'], "✓ Authorized"),
+                                    False: (c['orange'], "⚠ Unauthorized")}
+        self._detail_empty_item = canvas.create_text(self._detail_width / 2, 30,
+                                                     text="No active connections",
+                                                     font=self._f10,
+                                                     fill=c['text'],
+                                                     state='hidden')
+
+        # Close button
+        close_button = tk.Button(self.detail_window, 
+                               text="Close", 
+                               font=self._f10,
+                               bg=c['header_bg'],
+                               fg=c['text'],
+                               bd=0,
+                               padx=15,
+                               pady=5,
+                               activebackground=c['highlight'],
+                               activeforeground=c['text'],
+                               command=self._hide_detail_window)
+        close_button.pack(pady=10)
+
+    def _add_detail_row(self):
+        """Create the canvas items for one pooled connection row; _fill_detail_rows places them"""
+        c = self.colors
+        canvas = self._detail_canvas
+        tag = f"row{len(self._detail_rows)}"
+
+        # 'idx' is the connection the row currently has drawn, None when it needs redrawing;
+        # 'y' is where its items sit, None when they must be laid out from scratch
+        row = {'tag': tag, 'shown': False, 'idx': None, 'y': None}
+
+        # Separator above the row (hidden on the first connection)
+        row['sep'] = canvas.create_line(0, 0, 0, 0, fill=c['grid'], state='hidden', tags=tag)
+
+        # Connection header (Protocol and destination) with status indicator
+        row['header'] = canvas.create_text(0, 0, anchor='nw', font=self._f_bold10,
+                                           state='hidden', tags=tag)
+        row['auth'] = canvas.create_text(0, 0, anchor='ne', font=self._f9, state='hidden', tags=tag)
+
+        # Connection details
+        row['detail'] = canvas.create_text(0, 0, anchor='nw', font=self._f9,
+                                           fill=c['text'], state='hidden', tags=tag)
+
+        self._detail_rows.append(row)
+        return row
+
+    def _hide_detail_window(self):
+        """Close the details window by withdrawing it; it is shown again by _show_device_details"""
+        if self.detail_window is not None:
+            self.detail_window.withdraw()
+
+    def _on_detail_window_destroy(self, event):
+        """Forget the details window once it is destroyed (e.g. with the main window)"""
+        # Children's <Destroy> events also reach the toplevel binding
+        if event.widget is self.detail_window:
+            self.detail_window = None
+
+    def _on_detail_canvas_resize(self, event):
+        """Re-lay out the detail rows once the window stops resizing"""
+        self._detail_width = event.width
+        self._detail_view_height = event.height
+        self._debounce("detail_resize", 100, self._layout_detail_rows)
+
+    def _on_detail_scroll(self, *args):
+        """Scrollbar command: scroll the canvas, then move the row pool into view"""
+        self._detail_canvas.yview(*args)
+        self._fill_detail_rows()
+
+    def _on_detail_wheel(self, event):
+        """Scroll the connection list with the mouse wheel"""
+        up = event.num == 4 or event.delta > 0
+        self._on_detail_scroll("scroll", -1 if up else 1, "units")
+
+    def _layout_detail_rows(self):
+        """Fit the scroll region and the row pool to the resized canvas"""
+        if self.detail_window is None:
+            return
+        width = self._detail_width
+        if self._detail_region is not None and self._detail_region[2] == width:
+            # Only the height changed: the laid-out rows stay, the pool just covers more or less
+            self._fill_detail_rows()
+            return
+        self._detail_canvas.coords(self._detail_empty_item, width / 2, 30)
+        self._set_detail_scrollregion()
+        self._fill_detail_rows(redraw=True)
+
+    def _set_detail_scrollregion(self):
+        """Set the canvas scroll region from the width and row count, skipping no-op updates"""
+        region = (0, 0, self._detail_width, self._detail_height)
+        if region != self._detail_region:
+            self._detail_region = region
+            self._detail_canvas.configure(scrollregion=region)
+
+    def _populate_detail_window(self, device_idx):
+        """Rewrite the details window for the given device, reusing existing rows"""
+        device = self.node_data.devices[device_idx]
+        with self.node_data.lock:
+            n_conns = len(device["connections"])
+            self._detail_version = device["version"]
+        canvas = self._detail_canvas
+
+        self.detail_window.title(f"Device {device_idx+1} Details")
+        self._detail_title_label.config(text=f"{device['name']} ({device['ip']})")
+        self._detail_device = device
+
+        # No connections
+        canvas.itemconfig(self._detail_empty_item, state='hidden' if n_conns else 'normal')
+        # Scroll extent follows directly from the row count
+        self._detail_height = max(n_conns, 1) * self._detail_row_height
+        self._set_detail_scrollregion()
+        canvas.yview_moveto(0)
+        self._fill_detail_rows(redraw=True)
+
+    def _fill_detail_rows(self, redraw=False):
+        """Point the row pool at the connections currently scrolled into view"""
+        if self._detail_device is None:
+            return
+        auth_styles = self._detail_auth_styles
+        canvas = self._detail_canvas
+        row_h = self._detail_row_height
+        width = self._detail_width
+
+        # First connection at the top of the view, and enough rows to cover the view
+        first = max(int(canvas.canvasy(0) // row_h), 0)
+        visible = self._detail_view_height // row_h + 2
+        pool = self._detail_rows
+        if len(pool) < visible:
+            while len(pool) < visible:
+                self._add_detail_row()
+            redraw = True
+
+        # The serial thread appends rows and the data worker evicts them, so the rows in
+        # view are copied out under the data lock together with the table's version
+        with self.node_data.lock:
+            connections = self._detail_device["connections"]
+            end = min(first + len(pool), len(connections))
+            records = connections[first:end].tolist()
+            version = self._detail_device["version"]
+
+        # A connection was added or evicted, so texts cached by row number may belong to others
+        if version != self._detail_version:
+            self._detail_version = version
+            self._detail_texts.clear()
+            redraw = True
+
+        # Connection i is always drawn by pool[i % len(pool)] at its absolute y, so rows
+        # still in view keep their items as they are; only newly exposed rows are drawn
+        if redraw:
+            for row in pool:
+                row['idx'] = None
+                row['y'] = None
+
+        # Add connection details
+        now = time.perf_counter()
+        for i in range(first, end):
+            row = pool[i % len(pool)]
+            if row['idx'] == i:
+                continue
+            row['idx'] = i
+            # A recycled row shifts all its items with one move; only a fresh layout
+            # (new pool, resize) places each item for the current width
+            y = i * row_h
+            if row['y'] is None:
+                canvas.coords(row['sep'], 5, y, width - 5, y)
+                canvas.coords(row['header'], 10, y + 10)
+                canvas.coords(row['auth'], width - 10, y + 10)
+                canvas.coords(row['detail'], 10, y + 32)
+            else:
+                canvas.move(row['tag'], 0, y - row['y'])
+            row['y'] = y
+
+            (_, _, protocol, _, status, bytes_sent, bytes_received, packets, created,
+             _, authorized, label) = records[i - first]
+
+            texts = self._detail_texts.get(i)
+            if texts is None:
+                status_color, auth_text = auth_styles[authorized]
+
+                # Icon based on protocol
+                icon = _PROTO_ICON.get(protocol, "⟷")
+
+                texts = self._detail_texts[i] = (f"{icon} {label}", status_color, auth_text)
+            header_text, status_color, auth_text = texts
+
+            details_text = f"Status: {status}  |  Duration: {int(now - created)}s\n"
+            details_text += f"Bytes sent: {_format_bytes(bytes_sent)}  |  "
+            details_text += f"Received: {_format_bytes(bytes_received)}  |  "
+            details_text += f"Packets: {packets}"
+
+            canvas.itemconfig(row['header'],
+                              text=header_text,
+                              fill=status_color)
+            canvas.itemconfig(row['auth'], text=auth_text, fill=status_color)
+            canvas.itemconfig(row['detail'], text=details_text)
+            if not row['shown']:
+                canvas.itemconfig(row['tag'], state='normal')
+                row['shown'] = True
+            # No separator above the first connection
+            canvas.itemconfig(row['sep'], state='hidden' if i == 0 else 'normal')
+
+        # Hide pooled rows left outside the list (past its end, or stale after a redraw)
+        for row in pool:
+            if row['shown'] and (row['idx'] is None or not first <= row['idx'] < end):
+                canvas.itemconfig(row['tag'], state='hidden')
+                row['shown'] = False
+                row['idx'] = None
+
+    def _format_hover_texts(self, data):
+        """Pre-format the hover info label texts for the latest data"""
+        total_auth = data['total_auth_requests']
+        self._network_info_text = f"Total Traffic: {data['network_traffic_total']:.1f} MB/s"
+        self._auth_info_text = (f"Total Access Requests: {total_auth + data['total_unauth_requests']:,}"
+                                f" | Authorized: {total_auth:,}")
+        self._auth_gauge_info_text = f"Authorization Rate: {data['auth_percent']}%"
+        self._unauth_info_text = f"Total Alerts: {data['total_security_alerts']:,}"
+        self._unauth_gauge_info_text = f"Alert Level: {data['unauth_percent']}%"
+
+    def _debounce(self, key, ms, fn):
+        """Run fn after ms, replacing any call still pending under the same key"""
+        self._cancel_debounce(key)
+        self._hover_jobs[key] = self.root.after(ms, fn)
+
+    def _cancel_debounce(self, key):
+        """Drop the pending call for key, if any"""
+        job = self._hover_jobs.pop(key, None)
+        if job is not None:
+            self.root.after_cancel(job)
+
+    def _queue_hover_text(self, label, text):
+        """Show text on label at the next flush; motion events in between only replace it"""
+        self._hover_pending[label] = text
+        if self._hover_flush_id is None:
+            self._hover_flush_id = self.root.after(100, self._flush_hover_labels)
+
+    def _flush_hover_labels(self):
+        """Apply the latest queued text to each hovered info label"""
+        self._hover_flush_id = None
+        for label, text in self._hover_pending.items():
+            self._set_hover_text(label, text)
+        self._hover_pending.clear()
+
+    def _clear_hover_text(self, label):
+        """Drop any queued text for label and blank it"""
+        self._hover_pending.pop(label, None)
+        self._set_hover_text(label, "")
+
+    def _set_hover_text(self, label, text):
+        """Configure label only when its text actually changes"""
+        if self._hover_shown.get(label, "") != text:
+            self._hover_shown[label] = text
+            label.config(text=text)
 
     def _on_network_hover(self, event):
         """Handle hover over network traffic chart - pauses the chart updates"""
@@ -1640,9 +2606,7 @@ class FuturisticNetworkDashboard:
         self.node_data.paused = True
 
         # Show tooltip with network traffic details if available
-        if hasattr(self.node_data, 'last_data'):
-            total_traffic = sum(self.node_data.last_data['network_traffic'])
-            self.network_info_label.config(text=f"Total Traffic: {total_traffic:.1f} MB/s")
+        self._queue_hover_text(self.network_info_label, self._network_info_text)
 
     def _on_network_leave(self, event):
         """Handle mouse leave event - resumes chart updates"""
@@ -1651,7 +2615,7 @@ class FuturisticNetworkDashboard:
             self.node_data.paused = False
 
         # Clear tooltip
-        self.network_info_label.config(text="")
+        self._clear_hover_text(self.network_info_label)
 
         # Also hide any tooltips on the chart
         if self.network_chart and hasattr(self.network_chart, 'detail_tooltip') and self.network_chart.detail_tooltip:
@@ -1659,91 +2623,84 @@ class FuturisticNetworkDashboard:
 
     def _on_auth_hover(self, event):
         """Show details about network access monitoring on hover"""
-        if hasattr(self.node_data, 'last_data'):
-            data = self.node_data.last_data
-            if 'total_auth_requests' in data and 'total_unauth_requests' in data:
-                total_requests = data['total_auth_requests'] + data['total_unauth_requests']
-                auth_text = f"Total Access Requests: {total_requests:,}"
-                auth_text += f" | Authorized: {data['total_auth_requests']:,}"
-                self.auth_info_label.config(text=auth_text)
+        self._queue_hover_text(self.auth_info_label, self._auth_info_text)
 
     def _on_auth_leave(self, event):
         """Clear the auth info label on mouse leave"""
-        self.auth_info_label.config(text="")
+        self._clear_hover_text(self.auth_info_label)
 
     def _on_auth_gauge_hover(self, event):
         """Show details about authorization rate on hover"""
-        if hasattr(self.node_data, 'last_data'):
-            data = self.node_data.last_data
-            if 'auth_percent' in data:
-                auth_text = f"Authorization Rate: {data['auth_percent']}%"
-                self.auth_gauge_info_label.config(text=auth_text)
+        self._queue_hover_text(self.auth_gauge_info_label, self._auth_gauge_info_text)
 
     def _on_auth_gauge_leave(self, event):
         """Clear the auth gauge info label on mouse leave"""
-        self.auth_gauge_info_label.config(text="")
+        self._clear_hover_text(self.auth_gauge_info_label)
 
     def _on_unauth_hover(self, event):
         """Show details about security alerts on hover"""
-        if hasattr(self.node_data, 'last_data'):
-            data = self.node_data.last_data
-            if 'total_security_alerts' in data:
-                alert_text = f"Total Alerts: {data['total_security_alerts']:,}"
-                self.unauth_info_label.config(text=alert_text)
+        self._queue_hover_text(self.unauth_info_label, self._unauth_info_text)
 
     def _on_unauth_leave(self, event):
         """Clear the unauth info label on mouse leave"""
-        self.unauth_info_label.config(text="")
+        self._clear_hover_text(self.unauth_info_label)
 
     def _on_unauth_gauge_hover(self, event):
         """Show details about unauthorized access on hover"""
-        if hasattr(self.node_data, 'last_data'):
-            data = self.node_data.last_data
-            if 'unauth_percent' in data:
-                unauth_text = f"Alert Level: {data['unauth_percent']}%"
-                self.unauth_gauge_info_label.config(text=unauth_text)
+        self._queue_hover_text(self.unauth_gauge_info_label, self._unauth_gauge_info_text)
 
     def _on_unauth_gauge_leave(self, event):
         """Clear the unauth gauge info label on mouse leave"""
-        self.unauth_gauge_info_label.config(text="")
-
-    def _format_bytes(self, bytes_value):
-        """Format bytes to human-readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if bytes_value < 1024.0:
-                return f"{bytes_value:.1f} {unit}"
-            bytes_value /= 1024.0
-        return f"{bytes_value:.1f} TB"
+        self._clear_hover_text(self.unauth_gauge_info_label)
 
     def on_closing(self):
         """Handle application closing"""
         self.running = False
+        self._io_pool.shutdown(wait=False)
         self.root.destroy()
 
     def _export_data(self):
-        """Export network data to a CSV file"""
+        """Export network data to a CSV file; the file is written on a background thread"""
         current_dir = os.path.dirname(os.path.abspath(__file__))
         timestamp = time.strftime("%Y%m%d_%H%M%S")
         filepath = os.path.join(current_dir, f"network_data_{timestamp}.csv")
 
+        # Snapshot the exported columns here so the writer never races the serial reader.
+        # Each is one C-level concatenation across devices; whole rows are never copied
+        with self.node_data.lock:
+            tables = [device["connections"] for device in self.node_data.devices]
+            source, destination, authorized, sent, received = (
+                np.concatenate([conns[name] for conns in tables])
+                for name in ('source', 'destination', 'authorized', 'bytes_sent', 'bytes_received'))
+        traffic = sent + received
+        self._io_pool.submit(self._write_export, filepath, source, destination, authorized, traffic,
+                             time.strftime("%Y-%m-%d %H:%M:%S"))
+
+        # Auto-save every 12 hours
+        self.root.after(43200000, self._export_data)  # 12 hours in milliseconds
+
+    def _write_export(self, filepath, source, destination, authorized, traffic, timestamp):
+        """Write snapshotted connection columns to filepath, one row per connection"""
+        # Written under a temporary name and swapped in, so filepath is never half-written
+        tmp_path = filepath + ".tmp"
         try:
-            with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['Timestamp', 'Source IP', 'Destination IP', 'Authorized', 'Traffic Value']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                for device in self.node_data.devices:
-                    for conn in device["connections"]:
-                        writer.writerow({
-                            'Timestamp': time.strftime("%Y-%m-%d %H:%M:%S"),
-                            'Source IP': conn['source'],
-                            'Destination IP': conn['destination'],
-                            'Authorized': 'Yes' if conn['authorized'] else 'No',
-                            'Traffic Value': conn['bytes_sent'] + conn['bytes_received']
-                        })
+            with open(tmp_path, 'w', newline='', encoding='utf-8') as csvfile:
+                # Each column is converted to Python values once
+                sources = source.tolist()
+                destinations = destination.tolist()
+                rows = zip(sources, destinations, np.where(authorized, 'Yes', 'No').tolist(), traffic.tolist())
+
+                if _CSV_SPECIAL.search("".join(sources + destinations)) is None:
+                    # Nothing needs quoting, so the lines are formatted directly (same bytes csv would write)
+                    csvfile.write(",".join(_EXPORT_HEADER) + "\r\n")
+                    csvfile.write("".join(f"{timestamp},{source},{destination},{auth},{value}\r\n"
+                                          for source, destination, auth, value in rows))
+                else:
+                    writer = csv.writer(csvfile)
+                    writer.writerow(_EXPORT_HEADER)
+                    writer.writerows((timestamp,) + row for row in rows)
+            os.replace(tmp_path, filepath)
             print(f"Data exported successfully to {filepath}")
-
-            # Auto-save every 12 hours
-            self.root.after(43200000, self._export_data)  # 12 hours in milliseconds
         except Exception as e:
             print(f"Error exporting data: {e}")
 
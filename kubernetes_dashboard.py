@@ -9,14 +9,18 @@ from tkinter import ttk
 import time
 import datetime
 import threading
+import queue
 import numpy as np
 import random
+from collections import deque
 import matplotlib
 matplotlib.use("TkAgg")
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.patches import Wedge
-from matplotlib.ticker import MaxNLocator
+from matplotlib.ticker import MaxNLocator, FuncFormatter
+from queue_utils import put_latest
 
 class GaugeChart:
     """Gauge chart for displaying percentage metrics like memory and disk usage"""
@@ -93,7 +97,11 @@ class GaugeChart:
                 fontsize=18, fontweight='bold', color=self.font_color)
         
         # Draw the plot
-        self.canvas.draw()
+        self.canvas.draw_idle()
+    
+    def pack(self, **kwargs):
+        """Pack the chart widget"""
+        self.canvas_widget.pack(**kwargs)
 
 class LineChart:
     """Line chart for visualizing network metrics over time"""
@@ -121,15 +129,38 @@ class LineChart:
         # Add grid
         self.ax.grid(True, linestyle='-', alpha=0.3, color=grid_color)
         
-        # Create canvas
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self.parent)
-        self.canvas_widget = self.canvas.get_tk_widget()
-        self.canvas_widget.config(width=width, height=height)
-        
-        # Initialize empty plot
+        # The figure is rendered off the Tk thread with plain Agg; the Tk side only
+        # shows the finished frames in a PhotoImage on an ordinary canvas
+        self.canvas = FigureCanvasAgg(self.fig)
+        self.canvas_widget = tk.Canvas(self.parent, width=width, height=height,
+                                       bg=bg_color, highlightthickness=0)
+        self._photo = tk.PhotoImage(master=self.canvas_widget)
+        self.canvas_widget.create_image(0, 0, anchor=tk.NW, image=self._photo)
+        self._size = (width, height)
+        
+        # Initialize empty plot, keeping only the most recent 60 points
+        self.max_points = max_points = 60
         self.lines = []
-        self.data = [[] for _ in range(len(labels))]
-        self.timestamps = []
+        self.data = [deque(maxlen=max_points) for _ in range(len(labels))]
+        self.timestamps = deque(maxlen=max_points)
+        self._ticks = range(0)
+        self._tick_labels = ()
+        
+        # Per-sample extremes, so the y-range is found without scanning every point
+        self._sample_min = deque(maxlen=max_points)
+        self._sample_max = deque(maxlen=max_points)
+        
+        # Samples seen so far; ticks sit on every 6th absolute sample, so a tick keeps
+        # its label as the window slides and only its position moves
+        self._count = 0
+        self._tick_step = max_points // 10
+        
+        # Axis state last applied to the figure (render thread only)
+        self._bg = None
+        # Frames rendered by each path; in steady state nearly all should be blits
+        self.frame_counts = {'full': 0, 'blit': 0}
+        self._shown_ticks = None
+        self._shown_labels = None
         
         # Create tooltip
         self.tooltip = tk.Label(
@@ -145,40 +176,89 @@ class LineChart:
         )
         
         # Connect events
-        self.fig.canvas.mpl_connect('motion_notify_event', self.on_hover)
-        self.fig.canvas.mpl_connect('figure_leave_event', self.on_leave)
+        self.canvas_widget.bind('<Motion>', self.on_hover)
+        self.canvas_widget.bind('<Leave>', self.on_leave)
+        self.canvas_widget.bind('<Configure>', self._on_resize)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
         
         # Initial plot setup
         self._setup_plot()
+        self._ylim = self.ax.get_ylim()
+        # The x-range is the whole window from the start, so it never forces a full redraw
+        self.ax.set_xlim(0, max_points - 1)
+        
+        # Persistent line artists, repainted over a cached background each tick
+        for i in range(min(len(labels), len(colors))):
+            line, = self.ax.plot([], [], color=colors[i], lw=line_width,
+                                 label=labels[i], animated=True)
+            self.lines.append(line)
+        if self.lines:
+            self.ax.legend(loc='upper left', fontsize=8).set_animated(True)
+        
+        # The x-axis scrolls with the data, so it is repainted with the lines; the
+        # legend is repainted after it to stay on top of the moving grid lines
+        self.ax.xaxis.set_animated(True)
+        self._animated = [self.ax.xaxis] + self.lines
+        if self.ax.get_legend() is not None:
+            self._animated.append(self.ax.get_legend())
+        
+        # Tick text is looked up by window position, so moving the ticks keeps their labels
+        self._tick_text = {}
+        self.ax.xaxis.set_major_formatter(FuncFormatter(lambda x, pos: self._tick_text.get(int(round(x)), '')))
+        self.ax.tick_params(axis='x', labelrotation=45)
+        
+        # Lay out once, with placeholder tick labels standing in for the real ones
+        self.ax.set_xticks(range(0, max_points, self._tick_step))
+        self._tick_text = dict.fromkeys(range(0, max_points, self._tick_step), '00:00')
+        self.fig.tight_layout()
+        self._tick_text = {}
+        
+        # Render worker: takes frame requests and hands back PPM frames.
+        # Both queues hold one item, so at most one render is in flight.
+        # Requests are numbered; Tk polls for frames only until the newest one is shown
+        self._fig_lock = threading.Lock()
+        self._render_q = queue.Queue(maxsize=1)
+        self._frame_q = queue.Queue(maxsize=1)
+        self._requested_seq = 0
+        self._shown_seq = 0
+        self._drain_id = None
+        self._closed = False
+        threading.Thread(target=self._render_loop, daemon=True).start()
+        self.canvas_widget.bind('<Destroy>', self._on_destroy, add='+')
+        
+        # Initial (empty) frame
+        self._request_frame()
         
         # Pack the canvas
         self.canvas_widget.pack(fill=tk.BOTH, expand=True)
         
     def on_hover(self, event):
         """Handle mouse hover event"""
-        if event.inaxes == self.ax:
+        # Tk measures y down from the top, matplotlib up from the bottom
+        with self._fig_lock:
+            x, y = event.x, self._size[1] - event.y
+            inside = self.ax.bbox.contains(x, y)
+            if inside:
+                xdata, ydata = self.ax.transData.inverted().transform((x, y))
+        
+        if inside:
             # Find the closest point for each line
-            closest_line = None
             closest_distance = float('inf')
             closest_idx = -1
             closest_line_idx = -1
             
-            for i, line in enumerate(self.lines):
-                if not line or len(line.get_xdata()) == 0:
-                    continue
-                    
-                for j, (x, y) in enumerate(zip(line.get_xdata(), line.get_ydata())):
-                    distance = np.sqrt((event.xdata - x) ** 2 + (event.ydata - y) ** 2)
+            for i, values in enumerate(self.data[:len(self.lines)]):
+                for j, y in enumerate(values):
+                    distance = np.sqrt((xdata - j) ** 2 + (ydata - y) ** 2)
                     if distance < closest_distance and distance < 3:  # Threshold for detection
                         closest_distance = distance
-                        closest_line = line
                         closest_idx = j
                         closest_line_idx = i
             
-            if closest_line is not None and closest_idx >= 0 and closest_line_idx >= 0:
+            if closest_idx >= 0 and closest_line_idx >= 0:
                 # Get device info 
                 device_name = self.labels[closest_line_idx] if closest_line_idx < len(self.labels) else "Device"
-                value = closest_line.get_ydata()[closest_idx]
+                value = self.data[closest_line_idx][closest_idx]
                 
                 # Format tooltip text
                 tooltip_text = f"Device: {device_name}\nTraffic: {value:.2f}"
@@ -188,14 +268,35 @@ class LineChart:
                 self.tooltip.place(x=event.x + 15, y=event.y + 10)
                 self.tooltip.lift()
                 return
-            
-            # Hide tooltip if not over a point
-            self.tooltip.place_forget()
+        
+        # Hide tooltip if not over a point
+        self.tooltip.place_forget()
     
     def on_leave(self, event):
         """Handle mouse leave event"""
         self.tooltip.place_forget()
     
+    def _on_resize(self, event):
+        """Re-render at the widget's new size"""
+        if (event.width, event.height) != self._size and event.width > 1 and event.height > 1:
+            self._size = (event.width, event.height)
+            self._request_frame()
+    
+    def _on_destroy(self, event):
+        """Stop polling and let the render thread exit"""
+        self._closed = True
+        put_latest(self._render_q, None)
+    
+    def _on_draw(self, event):
+        """Cache the static background after a full redraw and put the moving artists back"""
+        self._bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+    
+    def _draw_animated(self):
+        """Draw the x-axis, lines and legend on top of whatever is in the canvas buffer"""
+        for artist in self._animated:
+            self.ax.draw_artist(artist)
+    
     def _setup_plot(self):
         """Set up the initial plot"""
         # Add title
@@ -220,9 +321,6 @@ class LineChart:
         self.ax.spines['bottom'].set_color(self.grid_color)
         self.ax.spines['left'].set_color(self.grid_color)
         
-        # Adjust layout
-        self.fig.tight_layout()
-    
     def update_data(self, new_values, timestamp=None):
         """Update the chart with new data points"""
         if timestamp is None:
@@ -234,57 +332,120 @@ class LineChart:
             if i < len(self.data):
                 self.data[i].append(value)
         
-        # Keep only the most recent 60 points
-        max_points = 60
-        if len(self.timestamps) > max_points:
-            self.timestamps = self.timestamps[-max_points:]
-            for i in range(len(self.data)):
-                self.data[i] = self.data[i][-max_points:]
-        
-        # Clear previous plot
-        self.ax.clear()
-        self.lines = []
-        
-        # Setup plot again
-        self._setup_plot()
-        
-        # Plot each line
-        for i, values in enumerate(self.data):
-            if i < len(self.colors) and values:
-                line, = self.ax.plot(range(len(values)), values, 
-                                    color=self.colors[i], 
-                                    lw=self.line_width, 
-                                    label=self.labels[i])
-                self.lines.append(line)
-        
-        # Set x-axis ticks
-        step = max(1, len(self.timestamps) // 10)
-        ticks = range(0, len(self.timestamps), step)
-        self.ax.set_xticks(ticks)
-        self.ax.set_xticklabels([self.timestamps[i] for i in ticks], rotation=45)
-        
-        # Set y-axis limits
-        all_values = [v for sublist in self.data for v in sublist if v is not None]
-        if all_values:
-            y_min = min(0, min(all_values) * 0.9)
-            y_max = max(all_values) * 1.1
-            self.ax.set_ylim(y_min, y_max)
-        
-        # Add legend
-        if self.lines:
-            self.ax.legend(loc='upper left', fontsize=8)
-        
-        # Draw the plot
-        self.canvas.draw()
+        present = [v for v in new_values[:len(self.data)] if v is not None]
+        if present:
+            self._sample_min.append(min(present))
+            self._sample_max.append(max(present))
+        
+        # Set x-axis ticks at the window positions of the anchored samples
+        self._count += 1
+        n = len(self.timestamps)
+        self._ticks = range(-(self._count - n) % self._tick_step, n, self._tick_step)
+        self._tick_labels = tuple(self.timestamps[i] for i in self._ticks)
+        
+        # Set y-axis limits, ignoring moves of under 5% unless data would be clipped
+        ylim = self._y_limits()
+        if ylim is not None:
+            lo, hi = self._ylim
+            slack = (hi - lo) * 0.05
+            clipped = (self._sample_min and min(self._sample_min) < lo) or \
+                (self._sample_max and max(self._sample_max) > hi)
+            if clipped or abs(ylim[0] - lo) > slack or abs(ylim[1] - hi) > slack:
+                self._ylim = ylim
+        
+        self._request_frame()
+    
+    def _request_frame(self):
+        """Hand a snapshot of the current data to the render thread"""
+        series = tuple(np.array(values, dtype=float) for values in self.data[:len(self.lines)])
+        self._requested_seq += 1
+        put_latest(self._render_q, (self._requested_seq, (series, self._ticks, self._tick_labels,
+                                                          self._ylim, self._size)))
+        if self._drain_id is None:
+            self._drain_id = self.canvas_widget.after(33, self._drain)
+    
+    def _render_loop(self):
+        """Render requested frames with Agg and queue each one as PPM data"""
+        while True:
+            request = self._render_q.get()
+            if request is None:
+                return
+            seq, frame_args = request
+            with self._fig_lock:
+                if self._apply_frame(*frame_args):
+                    self.frame_counts['full'] += 1
+                    self.canvas.draw()
+                else:
+                    # Only the moving artists are repainted over the cached background
+                    self.frame_counts['blit'] += 1
+                    self.canvas.restore_region(self._bg)
+                    self._draw_animated()
+                rgba = np.asarray(self.canvas.buffer_rgba())
+            frame = b'P6 %d %d 255\n' % (rgba.shape[1], rgba.shape[0]) + rgba[..., :3].tobytes()
+            put_latest(self._frame_q, (seq, frame))
+    
+    def _apply_frame(self, series, ticks, tick_labels, ylim, size):
+        """Move the lines and axes to a frame request; True if it needs a full redraw (render thread only)"""
+        full = self._bg is None
+        width, height = size
+        if self.fig.bbox.size.tolist() != [width, height]:
+            self.fig.set_size_inches(width / 100, height / 100)
+            self.fig.tight_layout()
+            full = True
+        
+        # Move the existing lines to the new data
+        n = max((len(values) for values in series), default=0)
+        xs = np.arange(n)
+        for line, values in zip(self.lines, series):
+            line.set_data(xs[:len(values)], values)
+        
+        # The x-axis is repainted every frame, so moving ticks needs no full redraw;
+        # the label lookup is only rebuilt when the ticks or their text change
+        if ticks != self._shown_ticks or tick_labels != self._shown_labels:
+            if ticks != self._shown_ticks:
+                self.ax.set_xticks(ticks)
+            self._shown_ticks = ticks
+            self._shown_labels = tick_labels
+            self._tick_text = dict(zip(ticks, tick_labels))
+        
+        # A y-range change redraws everything
+        if self.ax.get_ylim() != ylim:
+            self.ax.set_ylim(ylim)
+            full = True
+        return full
+    
+    def _drain(self):
+        """Show the latest finished frame, if any, and poll again until the newest request is shown"""
+        self._drain_id = None
+        if self._closed:
+            return
+        try:
+            self._shown_seq, frame = self._frame_q.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            self._photo.configure(data=frame, format='PPM')
+        if self._shown_seq < self._requested_seq:
+            self._drain_id = self.canvas_widget.after(33, self._drain)
+    
+    def pack(self, **kwargs):
+        """Pack the chart widget"""
+        self.canvas_widget.pack(**kwargs)
+    
+    def _y_limits(self):
+        """Y-axis range that fits the current data"""
+        if not self._sample_max:
+            return None
+        return (min(0, min(self._sample_min) * 1.1), max(0, max(self._sample_max) * 1.1))
 
 class MultiLineChart(LineChart):
     """Multi-line chart for memory usage display"""
     def __init__(self, parent, title, labels, colors, bg_color='#151515', grid_color='#333', 
                 width=600, height=200, y_min=0, y_max=5, y_label='GB', font_color='white'):
-        super().__init__(parent, title, labels, colors, bg_color, grid_color, width, height, 1.5, font_color)
         self.y_min = y_min
         self.y_max = y_max
         self.y_label = y_label
+        super().__init__(parent, title, labels, colors, bg_color, grid_color, width, height, 1.5, font_color)
         
     def _setup_plot(self):
         """Override the setup_plot method to customize for memory display"""
@@ -300,9 +461,10 @@ class MultiLineChart(LineChart):
         # Extract values in the order of labels
         values = [data_dict.get(label, 0) for label in self.labels]
         super().update_data(values, timestamp)
-        
-        # Fixed y-axis
-        self.ax.set_ylim(self.y_min, self.y_max)
+    
+    def _y_limits(self):
+        """Fixed y-axis"""
+        return (self.y_min, self.y_max)
 
 class DiskIOChart(LineChart):
     """Special line chart for disk I/O with positive and negative values"""
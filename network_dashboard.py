@@ -7,7 +7,9 @@ A single-file application that monitors network traffic for multiple devices
 import os
 import sys
 import time
-import random
+import queue
+import threading
+from collections import deque
 import tkinter as tk
 from tkinter import ttk
 import numpy as np
@@ -18,6 +20,26 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.patches import Circle, Wedge
 from matplotlib.ticker import MaxNLocator
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional - without it the kernels below run as plain NumPy
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+@njit(cache=True, nogil=True)
+def _step(base_out, unauth_mask, load_values, load_dirs, rng_u1, rng_u2, rng_u3, rng_u4):
+    """Advance the traffic and system load simulation by one tick (in place)"""
+    # Random traffic between 5 and 20, with a 15% chance of an unauthorized spike
+    unauth_mask[:] = rng_u2 < 0.15
+    base_out[:] = np.where(unauth_mask, (5.0 + 15.0 * rng_u1) * 3.0, 5.0 + 15.0 * rng_u1)
+    
+    # Change load direction occasionally, then wander within 100-300%
+    load_dirs[:] = np.where(rng_u3 < 0.1, -load_dirs, load_dirs)
+    load_values[:] = np.minimum(np.maximum(load_values + rng_u4 * 15.0 * load_dirs, 100.0), 300.0)
+
 class GaugeChart:
     """Gauge chart for displaying percentage metrics like memory and disk usage"""
     def __init__(self, parent, title="", max_value=100, bg_color='#252526', color='#4caf50', 
@@ -49,7 +71,7 @@ class GaugeChart:
         """Update the chart with a new value"""
         self.value = min(value, self.max_value)
         self._draw_gauge()
-        self.canvas.draw()
+        self.canvas.draw_idle()
     
     def _draw_gauge(self):
         """Draw the gauge chart"""
@@ -240,7 +262,7 @@ class LineChart:
             self.ax.set_xticklabels([self.timestamps[i] for i in tick_indices], rotation=30)
         
         # Update plot
-        self.canvas.draw()
+        self.canvas.draw_idle()
     
     def pack(self, **kwargs):
         """Pack the chart widget"""
@@ -296,12 +318,16 @@ class DiskIOChart(LineChart):
 
 class NetworkData:
     """Class for simulating network device data"""
-    def __init__(self):
-        # Data storage
-        self.network_traffic = []
-        self.system_load = []
-        self.auth_status = []  # List to track authorized/unauthorized access counts
-        self.timestamps = []
+    def __init__(self, interval=1.0):
+        # Data storage - the last 60 points, trimmed automatically on append
+        self.network_traffic = deque(maxlen=60)
+        self.system_load = deque(maxlen=60)
+        self.auth_status = deque(maxlen=60)  # Authorized/unauthorized access counts per point
+        self.timestamps = deque(maxlen=60)
+        
+        # Last formatted timestamp; only the minute is shown so reformat once per minute
+        self._ts_cache_minute = -1
+        self._ts_cache_str = ''
         
         # Current metrics
         self.current_network = 25.0
@@ -310,24 +336,55 @@ class NetworkData:
         
         # Device data for 7 devices
         self.devices = [
-            {"name": "Device 1", "ip": "192.168.1.100", "traffic": []},
-            {"name": "Device 2", "ip": "192.168.1.101", "traffic": []},
-            {"name": "Device 3", "ip": "192.168.1.102", "traffic": []},
-            {"name": "Device 4", "ip": "192.168.1.103", "traffic": []},
-            {"name": "Device 5", "ip": "192.168.1.104", "traffic": []},
-            {"name": "Device 6", "ip": "192.168.1.105", "traffic": []},
-            {"name": "Device 7", "ip": "192.168.1.106", "traffic": []}
+            {"name": "Device 1", "ip": "192.168.1.100", "traffic": deque(maxlen=60)},
+            {"name": "Device 2", "ip": "192.168.1.101", "traffic": deque(maxlen=60)},
+            {"name": "Device 3", "ip": "192.168.1.102", "traffic": deque(maxlen=60)},
+            {"name": "Device 4", "ip": "192.168.1.103", "traffic": deque(maxlen=60)},
+            {"name": "Device 5", "ip": "192.168.1.104", "traffic": deque(maxlen=60)},
+            {"name": "Device 6", "ip": "192.168.1.105", "traffic": deque(maxlen=60)},
+            {"name": "Device 7", "ip": "192.168.1.106", "traffic": deque(maxlen=60)}
         ]
         
-        # System load for 3 lines
-        self.load_values = [
-            {'value': 150, 'direction': 1},  # 1m
-            {'value': 180, 'direction': 1},  # 5m
-            {'value': 120, 'direction': 1}   # 15m
-        ]
+        # System load for 3 lines (1m, 5m, 15m)
+        self.load_values = np.array([150.0, 180.0, 120.0])
+        self.load_directions = np.ones(3)
+        
+        # Random stream and preallocated buffers for the simulation kernel
+        self.rng = np.random.default_rng()
+        self._traffic_out = np.empty(len(self.devices))
+        self._unauth_out = np.empty(len(self.devices), dtype=np.bool_)
         
         # Initialize with some data
         self._generate_initial_data()
+        
+        # New data points are produced on a background thread and handed to the UI
+        # through a small queue; the lock guards the history lists above
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._data_queue = queue.Queue(maxsize=4)
+        self._stop_event = threading.Event()
+        self._producer_thread = threading.Thread(target=self._producer, daemon=True)
+        self._producer_thread.start()
+    
+    def _producer(self):
+        """Generate data points at a fixed interval until stopped"""
+        while not self._stop_event.wait(self.interval):
+            with self._lock:
+                self._generate_next_data_point()
+                snapshot = self._snapshot()
+            try:
+                self._data_queue.put_nowait(snapshot)
+            except queue.Full:
+                # UI is behind - drop the oldest snapshot rather than the newest
+                try:
+                    self._data_queue.get_nowait()
+                except queue.Empty:
+                    pass
+                self._data_queue.put_nowait(snapshot)
+    
+    def stop(self):
+        """Stop the background producer thread"""
+        self._stop_event.set()
     
     def _generate_initial_data(self):
         """Initialize with 60 data points of historical data"""
@@ -336,44 +393,34 @@ class NetworkData:
     
     def _generate_next_data_point(self):
         """Generate the next data point with randomized fluctuations"""
-        timestamp = time.strftime('%H:%M')
-        self.timestamps.append(timestamp)
-        
-        # Keep only last 60 points
-        if len(self.timestamps) > 60:
-            self.timestamps = self.timestamps[-60:]
-            self.network_traffic = self.network_traffic[-60:]
-            self.system_load = self.system_load[-60:]
-            self.auth_status = self.auth_status[-60:]
-        
-        # Generate network traffic for each device with authorization status
-        network_values = []
-        auth_count = 0
-        unauth_count = 0
-        
-        for device in self.devices:
-            # Random traffic with occasional spikes
-            base_traffic = random.uniform(5, 20)
-            is_authorized = True
-            
-            if random.random() < 0.15:  # 15% chance of unauthorized access
-                # Create a traffic spike (unauthorized access)
-                base_traffic *= 3
-                is_authorized = False
-                unauth_count += 1
-            else:
-                auth_count += 1
-            
-            # Store device traffic
-            if len(device['traffic']) > 60:
-                device['traffic'] = device['traffic'][-60:]
+        now = time.time()
+        cur_min = int(now // 60)
+        if cur_min != self._ts_cache_minute:
+            self._ts_cache_minute = cur_min
+            self._ts_cache_str = time.strftime('%H:%M', time.localtime(now))
+        self.timestamps.append(self._ts_cache_str)
+        
+        # Draw all random samples for this tick at once and run the kernel
+        n_devices = self._traffic_out.size
+        n_loads = self.load_values.size
+        samples = self.rng.random(2 * (n_devices + n_loads))
+        _step(self._traffic_out, self._unauth_out, self.load_values, self.load_directions,
+              samples[:n_devices],
+              samples[n_devices:2 * n_devices],
+              samples[2 * n_devices:2 * n_devices + n_loads],
+              samples[2 * n_devices + n_loads:])
+        
+        # Store device traffic
+        network_values = self._traffic_out.tolist()
+        for device, base_traffic in zip(self.devices, network_values):
             device['traffic'].append(base_traffic)
-            network_values.append(base_traffic)
         
         # Store overall network traffic
         self.network_traffic.append(network_values)
         
         # Calculate and store auth percentages
+        unauth_count = int(self._unauth_out.sum())
+        auth_count = n_devices - unauth_count
         total = auth_count + unauth_count
         if total > 0:
             self.current_auth_percent = (auth_count / total) * 100
@@ -382,27 +429,21 @@ class NetworkData:
         # Store auth status for historical data
         self.auth_status.append([auth_count, unauth_count])
         
-        # Update system load (3 lines, wandering with trends)
-        current_loads = []
-        for i, load in enumerate(self.load_values):
-            # Change direction occasionally
-            if random.random() < 0.1:
-                load['direction'] *= -1
-            
-            # Update value with trend
-            change = (random.random() * 15) * load['direction']
-            load['value'] += change
-            
-            # Keep within reasonable bounds (100-300%)
-            load['value'] = max(100, min(300, load['value']))
-            current_loads.append(load['value'])
-        
-        self.system_load.append(current_loads)
+        # Store system load (3 lines, wandering with trends)
+        self.system_load.append(self.load_values.tolist())
     
     def update(self):
-        """Generate a new data point and return current metrics"""
-        self._generate_next_data_point()
-        
+        """Return the newest metrics from the producer thread, or None if nothing new"""
+        latest = None
+        try:
+            while True:
+                latest = self._data_queue.get_nowait()
+        except queue.Empty:
+            pass
+        return latest
+    
+    def _snapshot(self):
+        """Build the metrics dict for the current data point"""
         # Extract latest network traffic for each device
         network_values = []
         for device in self.devices:
@@ -416,7 +457,7 @@ class NetworkData:
             'auth_percent': self.current_auth_percent,
             'unauth_percent': self.current_unauth_percent,
             'auth_counts': auth_data,
-            'network_history': self.network_traffic,
+            'network_history': list(self.network_traffic),
             'system_load': self.system_load[-1],
             'timestamp': self.timestamps[-1]
         }
@@ -709,10 +750,10 @@ class NetworkDashboard:
     
     def update_ui(self):
         """Update the UI with the latest data"""
-        if self.running:
-            # Get the latest data
-            data = self.node_data.update()
-            
+        # Get the latest data (None if the producer has nothing new yet)
+        data = self.node_data.update() if self.running else None
+        
+        if data is not None:
             # Update Network Traffic chart (all 7 devices)
             self.cpu_chart.update_data(data['network_traffic'], data['timestamp'])
             
@@ -734,6 +775,7 @@ class NetworkDashboard:
     def on_closing(self):
         """Handle application closing"""
         self.running = False
+        self.node_data.stop()
         self.root.destroy()
 
 def main():
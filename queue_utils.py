@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+Queue Utilities Module
+Helpers for the bounded hand-off queues between the dashboards' worker threads and Tk
+"""
+
+import queue
+
+
+def put_latest(q, item):
+    """Put item on a bounded queue, dropping the oldest entry if the consumer is behind"""
+    try:
+        q.put_nowait(item)
+    except queue.Full:
+        try:
+            q.get_nowait()
+        except queue.Empty:
+            pass
+        q.put_nowait(item)
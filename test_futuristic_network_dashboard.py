@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Tests for the futuristic dashboard's port authorization rule
+"""
+
+import unittest
+
+import futuristic_network_dashboard as dashboard
+
+
+class IsAuthorizedTest(unittest.TestCase):
+    """Port bounds of NetworkData.is_authorized and the serial parser"""
+    def setUp(self):
+        self.data = dashboard.NetworkData()
+        self.ip = self.data.devices[0]["ip"]
+
+    def test_port_range_bounds(self):
+        self.assertTrue(self.data.is_authorized(self.ip, "10.0.0.1", "TCP", 0))
+        self.assertTrue(self.data.is_authorized(self.ip, "10.0.0.1", "TCP", 65534))
+        self.assertFalse(self.data.is_authorized(self.ip, "10.0.0.1", "TCP", 65535))
+        self.assertFalse(self.data.is_authorized(self.ip, "10.0.0.1", "TCP", 65536))
+        self.assertFalse(self.data.is_authorized(self.ip, "10.0.0.1", "TCP", -1))
+
+    def test_parser_rejects_ports_above_65535(self):
+        line = f"{self.ip},10.0.0.1,TCP,%d,1,1,ACTIVE".encode()
+        self.assertIsNotNone(self.data._parse_serial_line(line % 65535))
+        self.assertIsNone(self.data._parse_serial_line(line % 65536))
+
+
+if __name__ == "__main__":
+    unittest.main()